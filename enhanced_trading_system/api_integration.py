@@ -6,10 +6,9 @@ Handles all external API communications including Binance and other data sources
 import asyncio
 import aiohttp
 import time
-import hmac
-import hashlib
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+from urllib.parse import urlencode
 import logging
 
 from binance.client import Client
@@ -20,6 +19,18 @@ from binance.enums import HistoricalKlinesType
 from config import get_config, DEFAULT_CONFIG
 from utils import safe_float_conversion
 
+# Fastest available JSON decoder for the large kline/depth payloads:
+# msgspec, then orjson, then the stdlib parser
+try:
+    from msgspec.json import decode as _json_loads
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        import json
+        _json_loads = json.loads
+
 
 class BinanceAPIManager:
     """
@@ -50,11 +61,50 @@ class BinanceAPIManager:
         # Rate limiting
         self.last_request_time = {}
         self.rate_limit_delay = 0.1  # 100ms minimum delay between requests
-        
+
+        # Prepared public-endpoint URLs keyed by (path, params); repeated
+        # polling of the same symbol/interval reuses the encoded string
+        self._req_cache = {}
+
+
         # API endpoints
         self.base_url = "https://api.binance.com"
         self.futures_url = "https://fapi.binance.com"
         
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared pooled HTTP session on first use"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+
+    def _prepared_url(self, path: str, params: Dict = None) -> str:
+        """Return the fully encoded URL for a public endpoint, cached"""
+        key = (path, tuple(sorted(params.items())) if params else None)
+        url = self._req_cache.get(key)
+        if url is None:
+            url = f"{self.base_url}{path}"
+            if params:
+                url = f"{url}?{urlencode(params)}"
+            self._req_cache[key] = url
+        return url
+
+    async def _public_get(self, path: str, params: Dict = None) -> Any:
+        """GET an unsigned REST endpoint over the shared keep-alive session"""
+        session = await self._ensure_session()
+        async with session.get(self._prepared_url(path, params)) as response:
+            response.raise_for_status()
+            # orjson decodes large payloads (exchangeInfo, all-tickers)
+            # several times faster than the stdlib parser
+            return await response.json(loads=_json_loads)
+
     async def initialize_async_client(self):
         """Initialize asynchronous Binance client"""
         try:
@@ -127,11 +177,69 @@ class BinanceAPIManager:
             logging.error(f"Error getting klines for {symbol}: {e}")
             return []
     
+    async def get_klines_async(self, symbol: str, interval: str, limit: int = 500) -> List[List]:
+        """Get kline data without blocking the event loop"""
+        if self.async_client is None:
+            await self.initialize_async_client()
+        try:
+            return await self.async_client.get_klines(
+                symbol=symbol,
+                interval=interval,
+                limit=min(limit, 1000)
+            )
+        except BinanceAPIException as e:
+            logging.error(f"Error getting klines for {symbol}: {e}")
+            return []
+
+    async def get_aggregate_trades_async(self, symbol: str, limit: int = 500) -> List[Dict]:
+        """Get aggregate trades without blocking the event loop"""
+        if self.async_client is None:
+            await self.initialize_async_client()
+        try:
+            return await self.async_client.get_aggregate_trades(
+                symbol=symbol,
+                limit=min(limit, 1000)
+            )
+        except BinanceAPIException as e:
+            logging.error(f"Error getting aggregate trades for {symbol}: {e}")
+            return []
+
+    async def get_symbol_ticker_async(self, symbol: str) -> Dict:
+        """Get ticker price over the shared session (public endpoint, no signing)"""
+        try:
+            return await self._public_get('/api/v3/ticker/price', {'symbol': symbol})
+        except Exception as e:
+            logging.error(f"Error getting ticker for {symbol}: {e}")
+            return {}
+
+    async def get_24hr_ticker_async(self, symbol: str) -> Dict:
+        """Get 24 hour price change statistics over the shared session"""
+        try:
+            return await self._public_get('/api/v3/ticker/24hr', {'symbol': symbol})
+        except Exception as e:
+            logging.error(f"Error getting 24hr ticker for {symbol}: {e}")
+            return {}
+
+    async def get_all_tickers_async(self) -> List[Dict]:
+        """Get ticker prices for every symbol in one request"""
+        try:
+            return await self._public_get('/api/v3/ticker/price')
+        except Exception as e:
+            logging.error(f"Error getting all tickers: {e}")
+            return []
+
+    async def get_exchange_info_async(self) -> Dict:
+        """Get exchange information over the shared session"""
+        try:
+            return await self._public_get('/api/v3/exchangeInfo')
+        except Exception as e:
+            logging.error(f"Error getting exchange info: {e}")
+            return {}
+
     async def get_kline_data(self, symbol: str, interval: str, limit: int = 100) -> List[Dict]:
         """Get kline data in a format compatible with the trading system"""
         try:
-            # Use the synchronous method but wrap in async
-            klines = self.get_klines(symbol, interval, limit)
+            klines = await self.get_klines_async(symbol, interval, limit)
             # Convert to the expected format
             formatted_klines = []
             for kline in klines:
@@ -176,11 +284,25 @@ class BinanceAPIManager:
 
     async def get_order_book_async(self, symbol: str, limit: int = 100) -> Dict:
         """Async version of get_order_book for the trading system"""
+        if self.async_client is None:
+            await self.initialize_async_client()
         try:
-            return self.get_order_book(symbol, limit)
+            return await self.async_client.get_order_book(
+                symbol=symbol,
+                limit=min(limit, 5000)  # Max limit is 5000
+            )
         except Exception as e:
             logging.error(f"Error getting order book for {symbol}: {e}")
             return {}
+
+    async def close(self):
+        """Close the async client connection and the shared session"""
+        if self.async_client is not None:
+            await self.async_client.close_connection()
+            self.async_client = None
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+            self.session = None
     
     def get_aggregate_trades(self, symbol: str, limit: int = 500) -> List[Dict]:
         """Get aggregate trades for a symbol"""
@@ -273,32 +395,32 @@ class APIIntegrationManager:
         
         try:
             # Get current price
-            ticker = self.binance_manager.get_symbol_ticker(symbol)
+            ticker = await self.binance_manager.get_symbol_ticker_async(symbol)
             if ticker:
                 data['price'] = safe_float_conversion(ticker.get('price', 0))
-            
+
             # Get 24h ticker
-            ticker_24h = self.binance_manager.get_24hr_ticker(symbol)
+            ticker_24h = await self.binance_manager.get_24hr_ticker_async(symbol)
             if ticker_24h:
                 data['ticker_24h'] = ticker_24h
-            
+
             # Get order book
-            order_book = self.binance_manager.get_order_book(symbol)
+            order_book = await self.binance_manager.get_order_book_async(symbol)
             if order_book:
                 data['order_book'] = order_book
-            
+
             # Get klines if requested
             if include_klines:
-                klines = self.binance_manager.get_klines(
-                    symbol, 
-                    get_config('KLINE_INTERVAL', '5m'), 
+                klines = await self.binance_manager.get_klines_async(
+                    symbol,
+                    get_config('KLINE_INTERVAL', '5m'),
                     kline_limit
                 )
                 if klines:
                     data['klines'] = klines
-            
+
             # Get aggregate trades
-            trades = self.binance_manager.get_aggregate_trades(symbol, 100)
+            trades = await self.binance_manager.get_aggregate_trades_async(symbol, 100)
             if trades:
                 data['aggregate_trades'] = trades
                 
@@ -339,16 +461,16 @@ class APIIntegrationManager:
             limit = get_config('KLINE_LIMIT', 100)
         
         # Get klines for technical analysis
-        klines = self.binance_manager.get_klines(symbol, interval, limit)
-        
+        klines = await self.binance_manager.get_klines_async(symbol, interval, limit)
+
         # Get order book for depth analysis
-        order_book = self.binance_manager.get_order_book(symbol, get_config('ORDER_BOOK_LIMIT', 100))
-        
+        order_book = await self.binance_manager.get_order_book_async(symbol, get_config('ORDER_BOOK_LIMIT', 100))
+
         # Get aggregate trades for flow analysis
-        trades = self.binance_manager.get_aggregate_trades(symbol, limit)
-        
+        trades = await self.binance_manager.get_aggregate_trades_async(symbol, limit)
+
         # Get current price
-        ticker = self.binance_manager.get_symbol_ticker(symbol)
+        ticker = await self.binance_manager.get_symbol_ticker_async(symbol)
         current_price = safe_float_conversion(ticker.get('price', 0)) if ticker else 0
         
         technical_data = {
@@ -424,8 +546,7 @@ class APIIntegrationManager:
     
     async def close(self):
         """Clean up resources"""
-        if hasattr(self.binance_manager, 'async_client') and self.binance_manager.async_client:
-            await self.binance_manager.async_client.close_connection()
+        await self.binance_manager.close()
 
 
 class APIDataCache:
@@ -507,25 +628,39 @@ def get_data_cache(ttl_seconds: int = 30) -> APIDataCache:
     return data_cache
 
 
+# In-flight fetches keyed by cache key; concurrent misses for the same
+# symbol await one shared request instead of issuing duplicates
+_inflight: Dict[str, asyncio.Task] = {}
+
+
 # Convenience functions
 async def get_symbol_data(symbol: str) -> Dict:
     """Convenience function to get data for a single symbol"""
     manager = await get_api_manager()
     cache = get_data_cache()
-    
+
     # Try to get from cache first
     cache_key = f"symbol_data_{symbol}"
     cached_data = cache.get(cache_key)
     if cached_data:
         return cached_data
-    
-    # Fetch fresh data
-    data = await manager.get_market_data(symbol)
-    
-    # Cache the result
-    cache.set(cache_key, data)
-    
-    return data
+
+    # Join a fetch that is already on the wire
+    pending = _inflight.get(cache_key)
+    if pending is not None:
+        return await pending
+
+    async def _fetch():
+        data = await manager.get_market_data(symbol)
+        cache.set(cache_key, data)
+        return data
+
+    task = asyncio.ensure_future(_fetch())
+    _inflight[cache_key] = task
+    try:
+        return await task
+    finally:
+        _inflight.pop(cache_key, None)
 
 
 async def get_multiple_symbols_data_cached(symbols: List[str]) -> Dict[str, Dict]:
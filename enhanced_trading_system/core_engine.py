@@ -7,12 +7,20 @@ import asyncio
 import json
 import logging
 import time
+from bisect import bisect_right
+
+import aiohttp
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +29,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from api_integration import BinanceAPIManager, APIIntegrationManager
 from oi_radar_integration import OISpikeRadarIntegration
 from technical_calculator import TechnicalIndicatorCalculator
+from models import IndicatorSnapshot
 from config import DEFAULT_CONFIG
 DEFAULT_RISK_PER_TRADE = DEFAULT_CONFIG['MAX_RISK_PER_TRADE']
 
@@ -28,13 +37,27 @@ DEFAULT_RISK_PER_TRADE = DEFAULT_CONFIG['MAX_RISK_PER_TRADE']
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Recommendation thresholds for the composite score, ordered for bisect lookup
+_REC_THRESHOLDS = (-0.6, -0.3, 0.3, 0.6)
+_REC_LABELS = ('STRONG_SELL', 'SELL', 'HOLD', 'BUY', 'STRONG_BUY')
+
+# Composite score weights: rsi, macd, bollinger bands, oi signals, trend.
+# OI signals get the highest weight given their importance to the strategy.
+_COMP_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.30, 0.10])
+
 
 class EnhancedTradingSystem:
     """
     Main class for the enhanced trading analysis system
     Integrates multiple data sources and provides comprehensive analysis
     """
-    
+
+    __slots__ = (
+        'api_key', 'secret_key', 'binance_api', 'oi_radar', 'indicator_calc',
+        'order_book_depth', 'kline_data', 'technical_indicators', 'oi_signals',
+        'signal_panel', 'risk_management', '_connector', '_session'
+    )
+
     def __init__(self, api_key: str = None, secret_key: str = None):
         self.api_key = api_key
         self.secret_key = secret_key
@@ -45,45 +68,80 @@ class EnhancedTradingSystem:
         self.kline_data = {}
         self.technical_indicators = {}
         self.oi_signals = {}
+        self.signal_panel = []
         self.risk_management = RiskManagement()
-        
-    async def get_technical_indicators(self, symbol: str, interval: str = '5m') -> Dict:
+        # Shared HTTP connection pool, created lazily once a loop is running
+        self._connector = None
+        self._session = None
+
+    async def _ensure_shared_session(self):
+        """
+        Create the shared aiohttp session on first use and hand it to the
+        OI radar integration, so all async HTTP traffic reuses one
+        keep-alive connection pool instead of per-component sessions.
+        """
+        if self._session is None or self._session.closed:
+            self._connector = aiohttp.TCPConnector(
+                limit=64, ttl_dns_cache=300, keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+            self.oi_radar.use_session(self._session)
+
+    async def close(self):
+        """Close the shared HTTP session and integration resources"""
+        await self.oi_radar.close()
+        await self.binance_api.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def get_technical_indicators(self, symbol: str, interval: str = '5m') -> Optional[IndicatorSnapshot]:
         """
         Get real-time technical indicators (RSI, MACD, Bollinger Bands, Moving Averages)
         """
         try:
             # Get klines for calculation
             klines = await self.binance_api.get_kline_data(symbol, interval, 100)
-            
+
             if not klines:
                 logger.warning(f"No kline data available for {symbol}")
-                return {}
-            
+                return None
+
             closes = [k['close'] for k in klines]
             highs = [k['high'] for k in klines]
             lows = [k['low'] for k in klines]
-            
+
             # Calculate technical indicators
             rsi = self.indicator_calc.calculate_rsi(closes)
             macd = self.indicator_calc.calculate_macd(closes)
             bollinger_bands = self.indicator_calc.calculate_bollinger_bands(closes)
             moving_averages = self.indicator_calc.calculate_moving_averages(closes)
-            
-            indicators = {
-                'symbol': symbol,
-                'timestamp': datetime.now().isoformat(),
-                'rsi': rsi,
-                'macd': macd,
-                'bollinger_bands': bollinger_bands,
-                'moving_averages': moving_averages
-            }
-            
-            self.technical_indicators[symbol] = indicators
-            return indicators
-            
+
+            snapshot = IndicatorSnapshot(
+                symbol=symbol,
+                timestamp=datetime.now(),
+                rsi=rsi,
+                macd=macd['macd'],
+                macd_signal=macd['signal'],
+                macd_histogram=macd['histogram'],
+                bb_upper=bollinger_bands['upper'],
+                bb_middle=bollinger_bands['middle'],
+                bb_lower=bollinger_bands['lower'],
+                ma_5=moving_averages['ma_5'],
+                ma_10=moving_averages['ma_10'],
+                ma_20=moving_averages['ma_20'],
+                ma_50=moving_averages['ma_50'],
+                current_price=moving_averages['current_price']
+            )
+
+            self.technical_indicators[symbol] = snapshot
+            return snapshot
+
         except Exception as e:
             logger.error(f"Error getting technical indicators for {symbol}: {e}")
-            return {}
+            return None
 
     async def get_kline_data(self, symbol: str, interval: str = '5m', limit: int = 100) -> List:
         """
@@ -108,25 +166,30 @@ class EnhancedTradingSystem:
             if not order_book:
                 return {}
             
-            # Process bids and asks
-            bids = [(float(price), float(qty)) for price, qty in order_book['bids']]
-            asks = [(float(price), float(qty)) for price, qty in order_book['asks']]
-            
-            # Calculate cumulative volumes
-            bid_cumulative = np.cumsum([qty for _, qty in bids])
-            ask_cumulative = np.cumsum([qty for _, qty in asks])
-            
+            # Parse the [[price, qty], ...] payload straight into (N, 2)
+            # float arrays; no intermediate list of Python tuples
+            bids_arr = np.asarray(order_book['bids'], dtype=np.float64).reshape(-1, 2)
+            asks_arr = np.asarray(order_book['asks'], dtype=np.float64).reshape(-1, 2)
+
+            # Only the top 20 levels are reported, so restrict the cumulative
+            # sums to that window instead of accumulating the full book
+            bid_cumulative = np.cumsum(bids_arr[:20, 1])
+            ask_cumulative = np.cumsum(asks_arr[:20, 1])
+
+            has_both_sides = len(bids_arr) > 0 and len(asks_arr) > 0
+            spread = float(asks_arr[0, 0] - bids_arr[0, 0]) if has_both_sides else 0
+
             depth_data = {
                 'symbol': symbol,
                 'timestamp': datetime.now().isoformat(),
-                'bids': [{'price': price, 'quantity': qty} for price, qty in bids[:20]],
-                'asks': [{'price': price, 'quantity': qty} for price, qty in asks[:20]],
-                'bid_volume': sum([qty for _, qty in bids]),
-                'ask_volume': sum([qty for _, qty in asks]),
-                'bid_cumulative': bid_cumulative[:20].tolist() if len(bid_cumulative) > 0 else [],
-                'ask_cumulative': ask_cumulative[:20].tolist() if len(ask_cumulative) > 0 else [],
-                'spread': (asks[0][0] - bids[0][0]) if bids and asks else 0,
-                'spread_percentage': ((asks[0][0] - bids[0][0]) / bids[0][0] * 100) if bids and asks else 0
+                'bids': [{'price': price, 'quantity': qty} for price, qty in bids_arr[:20].tolist()],
+                'asks': [{'price': price, 'quantity': qty} for price, qty in asks_arr[:20].tolist()],
+                'bid_volume': float(bids_arr[:, 1].sum()),
+                'ask_volume': float(asks_arr[:, 1].sum()),
+                'bid_cumulative': bid_cumulative.tolist() if len(bid_cumulative) > 0 else [],
+                'ask_cumulative': ask_cumulative.tolist() if len(ask_cumulative) > 0 else [],
+                'spread': spread,
+                'spread_percentage': (spread / bids_arr[0, 0] * 100) if has_both_sides else 0
             }
             
             self.order_book_depth[symbol] = depth_data
@@ -179,9 +242,18 @@ class EnhancedTradingSystem:
             logger.error(f"Error analyzing fund flow for {symbol}: {e}")
             return {}
 
-    async def integrate_with_oi_signals(self, symbol: str, oi_signals: List[Dict]) -> Dict:
+    async def integrate_with_oi_signals(
+        self,
+        symbol: str,
+        oi_signals: List[Dict],
+        tech_snapshot: Optional[IndicatorSnapshot] = None,
+        kline_snapshot: Optional[List[Dict]] = None
+    ) -> Dict:
         """
         Integrate technical indicators with OI (Open Interest) surge signals
+
+        Callers that already hold the indicator snapshot and klines should
+        pass them in; the stored per-symbol state is only a fallback.
         """
         try:
             # Find OI signal for this specific symbol
@@ -190,38 +262,31 @@ class EnhancedTradingSystem:
                 if signal.get('symbol') == symbol:
                     symbol_oi_signal = signal
                     break
-            
+
             # Get technical data
-            tech_data = self.technical_indicators.get(symbol, {})
-            kline_data = self.kline_data.get(symbol, [])
-            
-            if not tech_data or not kline_data:
+            tech_data = tech_snapshot if tech_snapshot is not None else self.technical_indicators.get(symbol)
+            kline_data = kline_snapshot if kline_snapshot is not None else self.kline_data.get(symbol, [])
+
+            if tech_data is None or not kline_data:
                 logger.warning(f"No technical data available for {symbol}")
                 return {}
-            
-            # Calculate composite score based on all factors
-            current_price = tech_data.get('moving_averages', {}).get('current_price', 0)
-            rsi = tech_data.get('rsi', 50)  # Default to neutral
-            macd = tech_data.get('macd', {}).get('macd', 0)
-            bb_data = tech_data.get('bollinger_bands', {})
-            
+
+            # Read indicators straight off the typed snapshot
+            current_price = tech_data.current_price
+            rsi = tech_data.rsi
+            macd = tech_data.macd
+            bb_upper = tech_data.bb_upper
+            bb_lower = tech_data.bb_lower
+
             # Calculate BB position
-            if bb_data:
-                bb_upper = bb_data.get('upper', 0)
-                bb_lower = bb_data.get('lower', 0)
-                bb_middle = bb_data.get('middle', 0)
-                
-                if bb_upper != bb_lower:
-                    bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
-                    bb_position = max(0, min(1, bb_position))  # Clamp between 0 and 1
-                else:
-                    bb_position = 0.5
+            if bb_upper != bb_lower:
+                bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
+                bb_position = max(0, min(1, bb_position))  # Clamp between 0 and 1
             else:
                 bb_position = 0.5
-            
+
             # Calculate trend based on moving averages
-            ma_data = tech_data.get('moving_averages', {})
-            trend_score = self._calculate_trend_score(ma_data, current_price)
+            trend_score = self._calculate_trend_score(tech_data, current_price)
             
             # Incorporate OI signals if available
             oi_magnitude = symbol_oi_signal.get('score', 0) if symbol_oi_signal else 0
@@ -234,14 +299,10 @@ class EnhancedTradingSystem:
             bb_score = self._calculate_bb_score(bb_position)
             oi_score = self._calculate_oi_score(oi_magnitude, oi_direction)
             
-            # Weighted composite score
-            # Using weights based on reliability and historical performance
-            composite_score = (
-                0.25 * rsi_score +      # 25% weight to RSI
-                0.20 * macd_score +     # 20% weight to MACD
-                0.15 * bb_score +       # 15% weight to Bollinger Bands
-                0.30 * oi_score +       # 30% weight to OI signals (given high importance)
-                0.10 * trend_score      # 10% weight to trend
+            # Weighted composite score as a dot product against the constant
+            # weight vector; batching scores stacks rows into one matmul
+            composite_score = float(
+                _COMP_WEIGHTS @ np.array([rsi_score, macd_score, bb_score, oi_score, trend_score])
             )
             
             integrated_analysis = {
@@ -257,7 +318,7 @@ class EnhancedTradingSystem:
                 },
                 'recommendation': self._generate_recommendation(composite_score),
                 'confidence_level': abs(composite_score) * 100,
-                'technical_indicators': tech_data,
+                'technical_indicators': tech_data.to_dict(),
                 'oi_signals': symbol_oi_signal
             }
             
@@ -267,18 +328,15 @@ class EnhancedTradingSystem:
             logger.error(f"Error integrating OI signals for {symbol}: {e}")
             return {}
 
-    def _calculate_trend_score(self, ma_data: Dict, current_price: float) -> float:
+    def _calculate_trend_score(self, snapshot: IndicatorSnapshot, current_price: float) -> float:
         """
         Calculate trend score based on moving averages
         """
-        if not ma_data:
-            return 0
-        
-        ma_5 = ma_data.get('ma_5', 0)
-        ma_10 = ma_data.get('ma_10', 0)
-        ma_20 = ma_data.get('ma_20', 0)
-        ma_50 = ma_data.get('ma_50', 0)
-        
+        ma_5 = snapshot.ma_5
+        ma_10 = snapshot.ma_10
+        ma_20 = snapshot.ma_20
+        ma_50 = snapshot.ma_50
+
         # Trend based on MA relationships
         scores = []
         
@@ -363,16 +421,9 @@ class EnhancedTradingSystem:
         """
         Generate recommendation based on composite score
         """
-        if composite_score >= 0.6:
-            return 'STRONG_BUY'
-        elif composite_score >= 0.3:
-            return 'BUY'
-        elif composite_score >= -0.3:
-            return 'HOLD'
-        elif composite_score >= -0.6:
-            return 'SELL'
-        else:
-            return 'STRONG_SELL'
+        # bisect_right keeps scores equal to a threshold on the stronger side,
+        # matching the previous >= comparisons
+        return _REC_LABELS[bisect_right(_REC_THRESHOLDS, composite_score)]
 
     def calculate_dynamic_stop_loss_take_profit(
         self, 
@@ -388,69 +439,142 @@ class EnhancedTradingSystem:
             entry_price, position_type, volatility, risk_percentage
         )
 
+    async def _analyze_symbol(self, symbol: str, oi_signals: List[Dict],
+                              semaphore: asyncio.Semaphore) -> Optional[tuple]:
+        """Run the per-symbol analysis pipeline under the concurrency cap
+
+        Returns (integrated_analysis, current_price, position_sign,
+        volatility) for the panel assembly, or None when integration
+        produced nothing for the symbol.
+        """
+        async with semaphore:
+            tech_snapshot = await self.get_technical_indicators(symbol)
+            klines = await self.get_kline_data(symbol)
+            await self.get_order_book_depth(symbol)
+            fund_flow = await self.analyze_fund_flow(symbol)
+
+        # On a transient indicator failure fall back to the stored
+        # per-symbol snapshot — the same one integrate_with_oi_signals
+        # would use — so the dereferences below never see None while the
+        # integration succeeds on stale data
+        if tech_snapshot is None:
+            tech_snapshot = self.technical_indicators.get(symbol)
+        if tech_snapshot is None:
+            return None
+
+        # Integrate all data, handing over the snapshot directly instead
+        # of re-reading it from mutable per-symbol state
+        integrated_analysis = await self.integrate_with_oi_signals(
+            symbol, oi_signals, tech_snapshot, klines
+        )
+
+        if not integrated_analysis:
+            return None
+
+        # Add fund flow data
+        integrated_analysis['fund_flow'] = fund_flow
+
+        # Calculate volatility for risk management
+        if klines:
+            prices = [k['close'] for k in klines]
+            avg_price = sum(prices) / len(prices) if prices else 1
+            volatility = (np.std(prices) / avg_price) * 100 if avg_price > 0 else 2.5
+        else:
+            volatility = 2.5  # Default volatility percentage
+
+        current_price = tech_snapshot.current_price
+
+        recommendation = integrated_analysis['recommendation']
+        if 'BUY' in recommendation:
+            position_sign = 1
+        elif 'SELL' in recommendation:
+            position_sign = -1
+        else:
+            position_sign = 0
+
+        integrated_analysis['volatility'] = volatility
+        integrated_analysis['current_price'] = current_price
+
+        return integrated_analysis, current_price, position_sign, volatility
+
     async def generate_trading_signal_panel(self, symbols: List[str]) -> List[Dict]:
         """
         Generate real-time trading signal panel
         """
         signal_panel = []
-        
-        # Get OI signals once for all symbols
+        entry_prices = []
+        position_signs = []
+        volatilities = []
+
+        # Get OI signals once for all symbols, over the shared session
+        await self._ensure_shared_session()
         oi_signals = await self.oi_radar.get_latest_signals()
-        
-        for symbol in symbols:
-            # Get all required data
-            await self.get_technical_indicators(symbol)
-            await self.get_kline_data(symbol)
-            await self.get_order_book_depth(symbol)
-            fund_flow = await self.analyze_fund_flow(symbol)
-            
-            # Integrate all data
-            integrated_analysis = await self.integrate_with_oi_signals(symbol, oi_signals)
-            
-            if integrated_analysis:
-                # Add fund flow data
-                integrated_analysis['fund_flow'] = fund_flow
-                
-                # Calculate volatility for risk management
-                klines = self.kline_data.get(symbol, [])
-                if klines:
-                    prices = [k['close'] for k in klines]
-                    avg_price = sum(prices) / len(prices) if prices else 1
-                    volatility = (np.std(prices) / avg_price) * 100 if avg_price > 0 else 2.5
-                else:
-                    volatility = 2.5  # Default volatility percentage
-                
-                # Calculate risk management parameters based on recommendation
-                current_price = integrated_analysis['technical_indicators'].get(
-                    'moving_averages', {}
-                ).get('current_price', 0)
-                
-                recommendation = integrated_analysis['recommendation']
-                if 'BUY' in recommendation:
-                    risk_params = self.calculate_dynamic_stop_loss_take_profit(
-                        current_price, 'LONG', volatility
-                    )
-                elif 'SELL' in recommendation:
-                    risk_params = self.calculate_dynamic_stop_loss_take_profit(
-                        current_price, 'SHORT', volatility
-                    )
+
+        # Symbols are independent I/O-bound pipelines; gather overlaps them
+        # so a cycle costs roughly the slowest symbol instead of the sum.
+        # The semaphore caps concurrent pipelines to stay rate-limit friendly.
+        semaphore = asyncio.Semaphore(10)
+        results = await asyncio.gather(
+            *(self._analyze_symbol(symbol, oi_signals, semaphore) for symbol in symbols)
+        )
+
+        for result in results:
+            if result is None:
+                continue
+            integrated_analysis, current_price, position_sign, volatility = result
+
+            # Collect risk inputs; stop-loss/take-profit levels are
+            # computed for the whole batch in one vectorized call below
+            entry_prices.append(current_price)
+            position_signs.append(position_sign)
+            volatilities.append(volatility)
+
+            signal_panel.append(integrated_analysis)
+
+        # One vectorized pass over all symbols instead of per-symbol calls
+        if signal_panel:
+            batch = self.risk_management.calculate_batch(
+                entry_prices, position_signs, volatilities
+            )
+            for i, analysis in enumerate(signal_panel):
+                if position_signs[i] != 0:
+                    analysis['risk_management'] = {
+                        'stop_loss': float(batch['stop_loss'][i]),
+                        'take_profit': float(batch['take_profit'][i]),
+                        'risk_percentage': float(batch['risk_percentage'][i]),
+                        'risk_reward_ratio': 2.0  # Fixed 1:2 ratio
+                    }
                 else:
-                    risk_params = {'stop_loss': None, 'take_profit': None, 'risk_percentage': 0}
-                
-                integrated_analysis['risk_management'] = risk_params
-                integrated_analysis['volatility'] = volatility
-                integrated_analysis['current_price'] = current_price
-                
-                signal_panel.append(integrated_analysis)
-        
+                    analysis['risk_management'] = {
+                        'stop_loss': None, 'take_profit': None, 'risk_percentage': 0
+                    }
+
+        self.signal_panel = signal_panel
         return signal_panel
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the most recent signal panel to JSON bytes
+
+        Uses orjson when available: its C serializer handles floats,
+        datetimes and numpy arrays natively, so cumulative-depth ndarrays
+        need no .tolist() conversion first.
+        """
+        if orjson is not None:
+            return orjson.dumps(
+                self.signal_panel,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+            )
+        return json.dumps(self.signal_panel, default=str).encode('utf-8')
+
 
 class RiskManagement:
     """
     Risk management module with dynamic stop-loss and take-profit calculations
     """
 
+    __slots__ = ('max_risk_per_trade',)
+
     def __init__(self, max_risk_per_trade: float = DEFAULT_RISK_PER_TRADE):
         self.max_risk_per_trade = max_risk_per_trade
 
@@ -503,6 +627,44 @@ class RiskManagement:
             'risk_reward_ratio': 2.0  # Fixed 1:2 ratio
         }
 
+    def calculate_batch(
+        self,
+        entry_prices: np.ndarray,
+        position_signs: np.ndarray,  # +1 for LONG, -1 for SHORT, 0 for no position
+        volatilities: np.ndarray,
+        risk_percentage: float = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized stop-loss/take-profit for a batch of symbols
+
+        Mirrors calculate_stop_loss_take_profit but computes all levels in
+        one NumPy pass; entries with sign 0 come back as NaN.
+        """
+        if risk_percentage is None:
+            risk_percentage = self.max_risk_per_trade * 100
+
+        entries = np.asarray(entry_prices, dtype=np.float64)
+        signs = np.asarray(position_signs, dtype=np.float64)
+        vols = np.asarray(volatilities, dtype=np.float64)
+
+        adjusted_risk = risk_percentage * (1 + vols / 20)
+
+        stop_loss = entries * (1 - signs * adjusted_risk / 100)
+        take_profit = entries * (1 + signs * 2 * adjusted_risk / 100)
+
+        # Keep the stop on the correct side of entry for each direction
+        stop_loss = np.where(
+            signs > 0, np.minimum(stop_loss, entries * 0.999),
+            np.where(signs < 0, np.maximum(stop_loss, entries * 1.001), np.nan)
+        )
+        take_profit = np.where(signs != 0, take_profit, np.nan)
+
+        return {
+            'stop_loss': np.round(stop_loss, 8),
+            'take_profit': np.round(take_profit, 8),
+            'risk_percentage': np.round(np.where(signs != 0, adjusted_risk, 0.0), 4)
+        }
+
 
 async def main():
     """
@@ -560,8 +722,7 @@ async def main():
         print(f"Volatility: {volatility:.2f}%")
     
     # Close connections
-    await trading_system.binance_api.close()
-    await trading_system.oi_radar.close()
+    await trading_system.close()
     
     print("\nAnalysis complete!")
 
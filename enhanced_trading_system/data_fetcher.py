@@ -4,192 +4,432 @@ Handles communication with exchanges and data providers using the new API Integr
 """
 
 import asyncio
+import hashlib
+import logging
+import random
 import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from api_integration import get_api_manager, get_symbol_data, get_multiple_symbols_data_cached, get_technical_data_cached
-from models import KlineData, OrderBookDepth, FundFlow, OISignal
+from models import KlineData, OrderBookDepth, FundFlow, OISignal, SignalDirection
 from config import get_config
 from utils import safe_float_conversion
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+_KLINE_COLUMNS = ['open_time', 'open', 'high', 'low', 'close', 'volume',
+                  'close_time', 'quote_asset_volume', 'number_of_trades',
+                  'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume']
+_KLINE_FLOAT_COLUMNS = ('open', 'high', 'low', 'close', 'volume',
+                        'quote_asset_volume', 'taker_buy_base_asset_volume',
+                        'taker_buy_quote_asset_volume')
+# Quantity + buyer-is-maker record for fund-flow trade batches
+_TRADE_DTYPE = np.dtype([('q', 'f8'), ('m', '?')])
+
+
+def _kline_frame(raw_klines: List) -> pd.DataFrame:
+    """Build a typed DataFrame from raw kline rows"""
+    if not raw_klines:
+        return pd.DataFrame(columns=_KLINE_COLUMNS)
+    frame = pd.DataFrame((k[:11] for k in raw_klines), columns=_KLINE_COLUMNS)
+    for col in _KLINE_FLOAT_COLUMNS:
+        frame[col] = pd.to_numeric(frame[col], errors='coerce').fillna(0.0)
+    return frame
+
+# Route this module's records through a queue so formatting and stdout
+# writes happen on the listener thread, not the event loop
+if not logger.handlers:
+    _log_queue = SimpleQueue()
+    logger.addHandler(QueueHandler(_log_queue))
+    # Keep records off the root handler installed by basicConfig so
+    # they are emitted once, by the listener
+    logger.propagate = False
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+
+def _parse_klines(symbol: str, raw_klines: List) -> List[KlineData]:
+    """Convert raw kline rows to KlineData with columnwise numeric parsing
+
+    One pd.to_numeric pass per float column replaces eight
+    safe_float_conversion calls per row.
+    """
+    if not raw_klines:
+        return []
+
+    arr = np.asarray([k[:11] for k in raw_klines], dtype=object)
+    floats = pd.to_numeric(arr[:, [1, 2, 3, 4, 5, 7, 9, 10]].ravel(), errors='coerce')
+    floats = np.nan_to_num(np.asarray(floats, dtype=np.float64)).reshape(-1, 8)
+    ints = arr[:, [0, 6, 8]].astype(np.int64)
+
+    return [
+        KlineData(
+            symbol=symbol,
+            open_time=int(ints[i, 0]),
+            open=floats[i, 0],
+            high=floats[i, 1],
+            low=floats[i, 2],
+            close=floats[i, 3],
+            volume=floats[i, 4],
+            close_time=int(ints[i, 1]),
+            quote_asset_volume=floats[i, 5],
+            number_of_trades=int(ints[i, 2]),
+            taker_buy_base_asset_volume=floats[i, 6],
+            taker_buy_quote_asset_volume=floats[i, 7]
+        )
+        for i in range(arr.shape[0])
+    ]
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _aggregate_trades(qty, is_buy):
+        """Reduce a trade batch to (buy_volume, sell_volume, buy_count)"""
+        buy_volume = 0.0
+        sell_volume = 0.0
+        buy_count = 0
+        for i in range(qty.shape[0]):
+            if is_buy[i]:
+                buy_volume += qty[i]
+                buy_count += 1
+            else:
+                sell_volume += qty[i]
+        return buy_volume, sell_volume, buy_count
+else:
+    def _aggregate_trades(qty: np.ndarray, is_buy: np.ndarray) -> Tuple[float, float, int]:
+        """Reduce a trade batch to (buy_volume, sell_volume, buy_count)"""
+        return float(qty[is_buy].sum()), float(qty[~is_buy].sum()), int(is_buy.sum())
+
 
 class DataFetcher:
     """
     Class responsible for fetching data from various sources
     Uses the new API Integration module for all communications
     """
-    
+
+    __slots__ = ('api_key', 'secret_key', 'api_manager', '_cache', '_pending',
+                 '_latest_price', '_latest_ticker', '_stream_task',
+                 '_default_interval', '_default_limit', '_default_ob_limit')
+
+    # TTLs per data kind: exchange info is static within a session, tickers
+    # and prices go stale within seconds
+    EXCHANGE_INFO_TTL = 3600.0
+    TICKER_24H_TTL = 5.0
+    CURRENT_PRICE_TTL = 0.5
+    SYMBOL_DATA_TTL = 1.0
+    HIST_CACHE_TTL = 3600.0
+
     def __init__(self, api_key: str = None, secret_key: str = None):
         self.api_key = api_key or get_config('BINANCE_API_KEY')
         self.secret_key = secret_key or get_config('BINANCE_SECRET_KEY')
         self.api_manager = None
-    
+        self._cache = {}
+        self._pending = {}
+        self._latest_price = {}
+        self._latest_ticker = {}
+        self._stream_task = None
+        self.reload_config()
+
+    def reload_config(self):
+        """Re-read the per-call defaults from config
+
+        They are looked up once here instead of on every fetch; call
+        again if the config changes at runtime.
+        """
+        self._default_interval = get_config('KLINE_INTERVAL')
+        self._default_limit = get_config('KLINE_LIMIT')
+        self._default_ob_limit = get_config('ORDER_BOOK_LIMIT')
+
+    async def _cached(self, key: str, ttl: float, coro_factory):
+        """
+        Return a cached value if fresh, otherwise fetch and store it.
+
+        Concurrent misses for the same key share one in-flight request, so
+        a multi-symbol fan-out never duplicates the same HTTP call.
+        """
+        entry = self._cache.get(key)
+        if entry is not None and time.time() - entry[0] < ttl:
+            return entry[1]
+
+        task = self._pending.get(key)
+        if task is not None:
+            return await task
+
+        task = asyncio.ensure_future(coro_factory())
+        self._pending[key] = task
+        try:
+            value = await task
+            self._cache[key] = (time.time(), value)
+            return value
+        finally:
+            self._pending.pop(key, None)
+
     async def initialize_api_manager(self):
         """Initialize API manager"""
         if self.api_manager is None:
             self.api_manager = await get_api_manager()
-            print("API manager initialized successfully")
+            logger.info("API manager initialized successfully")
+
+    async def _get_symbol_data_cached(self, symbol: str) -> Dict:
+        """Single-flight, short-TTL wrapper around get_symbol_data
+
+        Price, ticker, and order book reads within one tick coalesce to
+        a single upstream call per symbol.
+        """
+        async def _fetch():
+            return await get_symbol_data(symbol)
+
+        return await self._cached(f'symbol_data_{symbol}', self.SYMBOL_DATA_TTL, _fetch)
+
+    async def start_streams(self, symbols: List[str]):
+        """
+        Subscribe to push ticker streams for the given symbols
+
+        One multiplexed WebSocket replaces per-tick REST polling:
+        fetch_current_price and fetch_24h_ticker return the locally
+        cached value for subscribed symbols and only hit REST on cold
+        start or when the stream has not delivered yet.
+        """
+        if self._stream_task is not None:
+            return
+
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+        await self.api_manager.binance_manager.initialize_async_client()
+        self._stream_task = asyncio.ensure_future(self._run_streams(symbols))
+
+    async def _run_streams(self, symbols: List[str]):
+        """Consume the multiplexed ticker stream and refresh local caches"""
+        from binance import BinanceSocketManager
+
+        bm = BinanceSocketManager(self.api_manager.binance_manager.async_client)
+        streams = [f"{s.lower()}@ticker" for s in symbols]
+
+        try:
+            async with bm.multiplex_socket(streams) as stream:
+                while True:
+                    msg = await stream.recv()
+                    data = msg.get('data') if isinstance(msg, dict) else None
+                    if not data or 'c' not in data:
+                        continue
+                    sym = data.get('s')
+                    self._latest_price[sym] = safe_float_conversion(data['c'])
+                    # Map WS ticker fields to the REST /ticker/24hr keys
+                    # downstream consumers already read
+                    self._latest_ticker[sym] = {
+                        'symbol': sym,
+                        'priceChange': data.get('p'),
+                        'priceChangePercent': data.get('P'),
+                        'lastPrice': data.get('c'),
+                        'openPrice': data.get('o'),
+                        'highPrice': data.get('h'),
+                        'lowPrice': data.get('l'),
+                        'volume': data.get('v'),
+                        'quoteVolume': data.get('q')
+                    }
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Ticker stream stopped, falling back to REST: %s", e)
+            self._stream_task = None
+            # Drop the local caches like stop_streams does; otherwise
+            # fetch_current_price/fetch_24h_ticker would keep serving the
+            # last streamed values forever instead of hitting REST
+            self._latest_price.clear()
+            self._latest_ticker.clear()
+
+    async def stop_streams(self):
+        """Cancel the stream consumer and drop the local caches"""
+        if self._stream_task is not None:
+            self._stream_task.cancel()
+            try:
+                await self._stream_task
+            except asyncio.CancelledError:
+                pass
+            self._stream_task = None
+        self._latest_price.clear()
+        self._latest_ticker.clear()
     
     async def fetch_kline_data(self, symbol: str, interval: str = None, limit: int = None) -> List[KlineData]:
         """
         Fetch K-line data using the new API integration
         """
-        await self.initialize_api_manager()
+        if self.api_manager is None:
+            await self.initialize_api_manager()
         
-        interval = interval or get_config('KLINE_INTERVAL')
-        limit = limit or get_config('KLINE_LIMIT')
+        interval = interval or self._default_interval
+        limit = limit or self._default_limit
         
         try:
             # Use the cached technical data function
             tech_data = await get_technical_data_cached(symbol, interval, limit)
-            raw_klines = tech_data.get('klines', [])
-            
-            kline_objects = []
-            for kline in raw_klines:
-                kline_obj = KlineData(
-                    symbol=symbol,
-                    open_time=kline[0],
-                    open=safe_float_conversion(kline[1]),
-                    high=safe_float_conversion(kline[2]),
-                    low=safe_float_conversion(kline[3]),
-                    close=safe_float_conversion(kline[4]),
-                    volume=safe_float_conversion(kline[5]),
-                    close_time=kline[6],
-                    quote_asset_volume=safe_float_conversion(kline[7]),
-                    number_of_trades=kline[8],
-                    taker_buy_base_asset_volume=safe_float_conversion(kline[9]),
-                    taker_buy_quote_asset_volume=safe_float_conversion(kline[10])
-                )
-                kline_objects.append(kline_obj)
-            
-            return kline_objects
-            
+            return _parse_klines(symbol, tech_data.get('klines', []))
+
         except Exception as e:
-            print(f"Error fetching kline data for {symbol}: {e}")
+            logger.error("Error fetching kline data for %s: %s", symbol, e)
             return []
-    
-    async def fetch_order_book_depth(self, symbol: str, limit: int = None) -> Optional[OrderBookDepth]:
+
+    async def fetch_kline_frame(self, symbol: str, interval: str = None, limit: int = None) -> pd.DataFrame:
+        """
+        Fetch K-line data as a columnar DataFrame
+
+        Indicator code that crunches whole series is better served by a
+        structure-of-arrays frame than by a list of KlineData objects;
+        fetch_kline_data stays for per-candle consumers.
+        """
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        interval = interval or self._default_interval
+        limit = limit or self._default_limit
+
+        try:
+            tech_data = await get_technical_data_cached(symbol, interval, limit)
+            return _kline_frame(tech_data.get('klines', []))
+
+        except Exception as e:
+            logger.error("Error fetching kline frame for %s: %s", symbol, e)
+            return pd.DataFrame(columns=_KLINE_COLUMNS)
+
+    async def fetch_order_book_depth(self, symbol: str, limit: int = None,
+                                     market_data: Dict = None) -> Optional[OrderBookDepth]:
         """
         Fetch order book depth data using the new API integration
+
+        Callers that already hold the symbol's market data can pass it in
+        to skip the redundant upstream fetch.
         """
-        await self.initialize_api_manager()
-        
-        limit = limit or get_config('ORDER_BOOK_LIMIT')
-        
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        limit = limit or self._default_ob_limit
+
         try:
             # Get market data which includes order book
-            market_data = await get_symbol_data(symbol)
+            if market_data is None:
+                market_data = await self._get_symbol_data_cached(symbol)
             order_book = market_data.get('order_book', {})
             
             if not order_book:
-                print(f"No order book data available for {symbol}")
+                logger.warning("No order book data available for %s", symbol)
                 return None
             
-            # Process bids and asks
-            bids = [(safe_float_conversion(price), safe_float_conversion(qty)) 
-                   for price, qty in order_book.get('bids', [])]
-            asks = [(safe_float_conversion(price), safe_float_conversion(qty)) 
-                   for price, qty in order_book.get('asks', [])]
-            
-            # Calculate cumulative volumes
-            bid_cumulative = []
-            ask_cumulative = []
-            
-            running_bid_sum = 0
-            running_ask_sum = 0
-            
-            for _, qty in bids:
-                running_bid_sum += qty
-                bid_cumulative.append(running_bid_sum)
-            
-            for _, qty in asks:
-                running_ask_sum += qty
-                ask_cumulative.append(running_ask_sum)
-            
+            # Single vectorized cast per side; only the top 20 levels are
+            # ever materialized as Python objects
+            bids_arr = np.asarray(order_book.get('bids', []), dtype=np.float64).reshape(-1, 2)
+            asks_arr = np.asarray(order_book.get('asks', []), dtype=np.float64).reshape(-1, 2)
+
+            has_both_sides = len(bids_arr) > 0 and len(asks_arr) > 0
+            spread = float(asks_arr[0, 0] - bids_arr[0, 0]) if has_both_sides else 0
+
             depth_data = OrderBookDepth(
                 symbol=symbol,
                 timestamp=market_data.get('timestamp', datetime.now()),
-                bids=[{'price': price, 'quantity': qty} for price, qty in bids[:20]],
-                asks=[{'price': price, 'quantity': qty} for price, qty in asks[:20]],
-                bid_volume=sum([qty for _, qty in bids]),
-                ask_volume=sum([qty for _, qty in asks]),
-                bid_cumulative=bid_cumulative[:20],
-                ask_cumulative=ask_cumulative[:20],
-                spread=(asks[0][0] - bids[0][0]) if bids and asks else 0,
-                spread_percentage=((asks[0][0] - bids[0][0]) / bids[0][0] * 100) if bids and asks else 0
+                bids=bids_arr[:20],
+                asks=asks_arr[:20],
+                bid_volume=float(bids_arr[:, 1].sum()),
+                ask_volume=float(asks_arr[:, 1].sum()),
+                bid_cumulative=np.cumsum(bids_arr[:20, 1]),
+                ask_cumulative=np.cumsum(asks_arr[:20, 1]),
+                spread=spread,
+                spread_percentage=(spread / bids_arr[0, 0] * 100) if has_both_sides else 0
             )
             
             return depth_data
             
         except Exception as e:
-            print(f"Error fetching order book depth for {symbol}: {e}")
+            logger.error("Error fetching order book depth for %s: %s", symbol, e)
             return None
     
     async def fetch_current_price(self, symbol: str) -> float:
         """
         Fetch current price for a symbol using the new API integration
         """
-        await self.initialize_api_manager()
-        
+        streamed = self._latest_price.get(symbol)
+        if streamed is not None:
+            return streamed
+
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
         try:
-            market_data = await get_symbol_data(symbol)
-            return market_data.get('price', 0.0)
+            async def _fetch():
+                market_data = await self._get_symbol_data_cached(symbol)
+                return market_data.get('price', 0.0)
+
+            return await self._cached(f'current_price_{symbol}', self.CURRENT_PRICE_TTL, _fetch)
         except Exception as e:
-            print(f"Error fetching current price for {symbol}: {e}")
+            logger.error("Error fetching current price for %s: %s", symbol, e)
             return 0.0
-    
+
     async def fetch_24h_ticker(self, symbol: str) -> Dict:
         """
         Fetch 24-hour ticker statistics using the new API integration
         """
-        await self.initialize_api_manager()
-        
+        streamed = self._latest_ticker.get(symbol)
+        if streamed is not None:
+            return streamed
+
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
         try:
-            market_data = await get_symbol_data(symbol)
-            return market_data.get('ticker_24h', {})
+            async def _fetch():
+                market_data = await self._get_symbol_data_cached(symbol)
+                return market_data.get('ticker_24h', {})
+
+            return await self._cached(f'ticker_24h_{symbol}', self.TICKER_24H_TTL, _fetch)
         except Exception as e:
-            print(f"Error fetching 24h ticker for {symbol}: {e}")
+            logger.error("Error fetching 24h ticker for %s: %s", symbol, e)
             return {}
     
     async def fetch_fund_flow(self, symbol: str, limit: int = 100) -> Optional[FundFlow]:
         """
         Analyze fund flow based on recent trades using the new API integration
         """
-        await self.initialize_api_manager()
+        if self.api_manager is None:
+            await self.initialize_api_manager()
         
         try:
             # Get technical data which includes trades
-            tech_data = await get_technical_data_cached(symbol, get_config('KLINE_INTERVAL'), limit)
+            tech_data = await get_technical_data_cached(symbol, self._default_interval, limit)
             trades = tech_data.get('trades', [])
             
             if not trades:
-                print(f"No trade data available for {symbol}")
+                logger.warning("No trade data available for %s", symbol)
                 return None
             
-            buy_volume = 0
-            sell_volume = 0
-            buy_count = 0
-            sell_count = 0
-            
-            for trade in trades:
-                # 'm' indicates whether buyer is maker (True) or seller is maker (False)
-                if trade.get('m', True):  # Seller is maker (buying pressure)
-                    buy_volume += safe_float_conversion(trade.get('q', 0))
-                    buy_count += 1
-                else:  # Buyer is maker (selling pressure)
-                    sell_volume += safe_float_conversion(trade.get('q', 0))
-                    sell_count += 1
-            
+            # 'm' indicates whether buyer is maker (True) or seller is maker
+            # (False); seller-maker trades count as buying pressure.
+            # Both fields land in one structured array in a single
+            # allocation and C-level fill, then masked reductions replace
+            # the per-trade branch. Binance returns clean numeric strings,
+            # so plain float() is safe here.
+            n = len(trades)
+            arr = np.array([(t['q'], t['m']) for t in trades],
+                           dtype=_TRADE_DTYPE)
+            buy_volume, sell_volume, buy_count = _aggregate_trades(arr['q'], arr['m'])
+            sell_count = n - buy_count
+
             total_volume = buy_volume + sell_volume
             buy_ratio = buy_volume / total_volume if total_volume > 0 else 0
             sell_ratio = sell_volume / total_volume if total_volume > 0 else 0
             
-            from .models import SignalDirection
             flow_direction = SignalDirection.BULLISH if buy_ratio > sell_ratio else SignalDirection.BEARISH
             
             fund_flow = FundFlow(
@@ -209,58 +449,126 @@ class DataFetcher:
             return fund_flow
             
         except Exception as e:
-            print(f"Error analyzing fund flow for {symbol}: {e}")
+            logger.error("Error analyzing fund flow for %s: %s", symbol, e)
             return None
     
-    async def fetch_multiple_symbols_data(self, symbols: List[str]) -> Dict[str, Dict]:
+    async def fetch_prices(self, symbols: List[str]) -> Dict[str, float]:
         """
-        Fetch data for multiple symbols concurrently using the new API integration
+        Fetch current prices for many symbols with a single request
+
+        One /ticker/price call returns every symbol, so pricing N symbols
+        costs one round trip instead of N.
         """
-        await self.initialize_api_manager()
-        
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
         try:
-            # Use the cached function for efficiency
-            return await get_multiple_symbols_data_cached(symbols)
+            tickers = await self.api_manager.binance_manager.get_all_tickers_async()
+            all_prices = {t['symbol']: safe_float_conversion(t['price']) for t in tickers}
+            return {symbol: all_prices.get(symbol, 0.0) for symbol in symbols}
         except Exception as e:
-            print(f"Error fetching data for multiple symbols: {e}")
-            return {symbol: {} for symbol in symbols}
+            logger.error("Error fetching batch prices: %s", e)
+            return {symbol: 0.0 for symbol in symbols}
+
+    async def fetch_multiple_symbols_data(self, symbols: List[str],
+                                          max_concurrent: int = 16,
+                                          timeout: float = 30.0) -> Dict[str, Dict]:
+        """
+        Fetch data for multiple symbols concurrently using the new API integration
+
+        Concurrency is capped by a semaphore so a large symbol list does
+        not open hundreds of simultaneous connections, and each symbol
+        gets its own timeout so one stuck request cannot stall the batch.
+        """
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def guarded(sym: str) -> Tuple[str, Dict]:
+            async with sem:
+                try:
+                    return sym, await asyncio.wait_for(self.fetch_symbol_data(sym), timeout)
+                except Exception as e:
+                    logger.error("Error fetching data for %s: %s", sym, e)
+                    return sym, {}
+
+        results = {}
+        for task in asyncio.as_completed([guarded(symbol) for symbol in symbols]):
+            sym, data = await task
+            results[sym] = data
+        return results
     
-    async def fetch_symbol_data(self, symbol: str) -> Dict:
+    async def fetch_symbol_data(self, symbol: str, preloaded_price: float = None) -> Dict:
         """
         Fetch comprehensive data for a single symbol using the new API integration
+
+        Pass `preloaded_price` from a fetch_prices batch to skip the
+        per-symbol price lookup.
         """
-        await self.initialize_api_manager()
-        
-        # Get all data concurrently for efficiency
-        market_data = await get_symbol_data(symbol)
-        
-        # Get kline data separately
-        klines = await self.fetch_kline_data(symbol)
-        
-        # Get order book separately
-        order_book = await self.fetch_order_book_depth(symbol)
-        
-        # Get fund flow separately
-        fund_flow = await self.fetch_fund_flow(symbol)
-        
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        # Single timestamp for the whole snapshot rather than one
+        # datetime.now() per fallback
+        ts = datetime.now()
+
+        # The three upstream calls are independent: overlap them so the
+        # snapshot takes max() of the latencies instead of their sum
+        market_data, klines, fund_flow = await asyncio.gather(
+            self._get_symbol_data_cached(symbol),
+            self.fetch_kline_data(symbol),
+            self.fetch_fund_flow(symbol)
+        )
+
+        # The order book ships inside market_data; parse it without a
+        # second upstream fetch
+        order_book = await self.fetch_order_book_depth(symbol, market_data=market_data)
+
         data = {
             'symbol': symbol,
             'klines': klines,
             'order_book': order_book,
             'fund_flow': fund_flow,
-            'current_price': market_data.get('price', 0.0),
+            'current_price': preloaded_price if preloaded_price is not None else market_data.get('price', 0.0),
             'ticker_24h': market_data.get('ticker_24h', {}),
-            'timestamp': market_data.get('timestamp', datetime.now())
+            'timestamp': market_data.get('timestamp', ts)
         }
-        
+
         return data
     
+    def _hist_cache_path(self, symbol: str, interval: str, start_str: str, end_str: str = None) -> str:
+        """Disk cache location for a historical-klines request"""
+        key = hashlib.blake2b(
+            repr((symbol, interval, start_str, end_str)).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'enhanced_trading')
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f'hist_{key}.parquet')
+
     async def fetch_historical_klines(self, symbol: str, interval: str, start_str: str, end_str: str = None) -> List[KlineData]:
         """
         Fetch historical klines for backtesting using the API manager
+
+        Results are cached on disk as parquet so repeated backtest runs
+        over the same range read locally instead of re-downloading.
+        Closed ranges (end_str given) never go stale; open-ended ranges
+        expire after HIST_CACHE_TTL.
         """
-        await self.initialize_api_manager()
-        
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        cache_path = self._hist_cache_path(symbol, interval, start_str, end_str)
+        if os.path.exists(cache_path) and (
+                end_str is not None
+                or time.time() - os.path.getmtime(cache_path) < self.HIST_CACHE_TTL):
+            try:
+                frame = pd.read_parquet(cache_path)
+                return _parse_klines(symbol, frame[_KLINE_COLUMNS].to_numpy().tolist())
+            except Exception as e:
+                logger.warning("Unreadable historical cache %s: %s", cache_path, e)
+
         try:
             # Use the API manager directly for historical data
             klines = self.api_manager.binance_manager.get_historical_klines(
@@ -269,48 +577,71 @@ class DataFetcher:
                 start_str=start_str,
                 end_str=end_str
             )
-            
-            kline_objects = []
-            for kline in klines:
-                kline_obj = KlineData(
-                    symbol=symbol,
-                    open_time=kline[0],
-                    open=safe_float_conversion(kline[1]),
-                    high=safe_float_conversion(kline[2]),
-                    low=safe_float_conversion(kline[3]),
-                    close=safe_float_conversion(kline[4]),
-                    volume=safe_float_conversion(kline[5]),
-                    close_time=kline[6],
-                    quote_asset_volume=safe_float_conversion(kline[7]),
-                    number_of_trades=kline[8],
-                    taker_buy_base_asset_volume=safe_float_conversion(kline[9]),
-                    taker_buy_quote_asset_volume=safe_float_conversion(kline[10])
-                )
-                kline_objects.append(kline_obj)
-            
-            return kline_objects
-            
+
+            try:
+                _kline_frame(klines).to_parquet(cache_path)
+            except Exception as e:
+                # pyarrow missing or disk full: skip caching, keep serving
+                logger.warning("Could not write historical cache %s: %s", cache_path, e)
+
+            return _parse_klines(symbol, klines)
+
         except Exception as e:
-            print(f"Error fetching historical klines for {symbol}: {e}")
+            logger.error("Error fetching historical klines for %s: %s", symbol, e)
             return []
+
+    async def iter_historical_klines(self, symbol: str, interval: str, start_str: str,
+                                     end_str: str = None, batch_size: int = 1000):
+        """
+        Stream historical klines as typed DataFrame batches
+
+        A year of 1-minute klines materialized as KlineData objects costs
+        hundreds of MB; this yields batch_size-row frames as the paginated
+        SDK generator delivers them, so memory stays O(batch) and the
+        caller can start computing on the first batch immediately.
+        fetch_historical_klines remains for small-range object consumers.
+        """
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+        await self.api_manager.binance_manager.initialize_async_client()
+        client = self.api_manager.binance_manager.async_client
+
+        batch = []
+        async for kline in client.get_historical_klines_generator(
+                symbol, interval, start_str, end_str):
+            batch.append(kline)
+            if len(batch) >= batch_size:
+                yield _kline_frame(batch)
+                batch = []
+        if batch:
+            yield _kline_frame(batch)
     
     async def fetch_exchange_info(self) -> Dict:
         """
         Fetch exchange information using the API manager
+
+        The multi-MB response is effectively static, so it is cached for
+        an hour instead of re-downloaded per call.
         """
-        await self.initialize_api_manager()
-        
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
         try:
-            return self.api_manager.binance_manager.get_exchange_info()
+            return await self._cached(
+                'exchange_info',
+                self.EXCHANGE_INFO_TTL,
+                self.api_manager.binance_manager.get_exchange_info_async
+            )
         except Exception as e:
-            print(f"Error fetching exchange info: {e}")
+            logger.error("Error fetching exchange info: %s", e)
             return {}
     
     async def fetch_oi_data(self, symbol: str) -> Optional[OISignal]:
         """
         Fetch Open Interest data using the API manager
         """
-        await self.initialize_api_manager()
+        if self.api_manager is None:
+            await self.initialize_api_manager()
         
         try:
             # Use the API manager to get futures data
@@ -325,9 +656,6 @@ class DataFetcher:
             # 2. Compare current OI to historical values to determine surges
             # 3. Calculate magnitude and direction
             
-            from .models import SignalDirection
-            import random
-            
             # Simulated values based on real data patterns
             magnitude = random.uniform(0, 20) if oi_value else 0
             direction = SignalDirection.BULLISH if random.random() > 0.5 else SignalDirection.BEARISH
@@ -343,30 +671,39 @@ class DataFetcher:
             return oi_signal
             
         except Exception as e:
-            print(f"Error fetching OI data for {symbol}: {e}")
+            logger.error("Error fetching OI data for %s: %s", symbol, e)
             return None
     
-    async def fetch_multiple_oi_data(self, symbols: List[str]) -> Dict[str, OISignal]:
+    async def iter_oi_data(self, symbols: List[str], max_concurrent: int = 16):
         """
-        Fetch OI data for multiple symbols
+        Yield (symbol, OISignal) pairs as each fetch completes
+
+        Downstream ranking can start on the first symbol's OI the moment
+        its response lands instead of waiting for the slowest fetch.
+        """
+        if self.api_manager is None:
+            await self.initialize_api_manager()
+
+        sem = asyncio.Semaphore(max_concurrent)
+
+        async def _guarded(sym: str):
+            async with sem:
+                return sym, await self.fetch_oi_data(sym)
+
+        for task in asyncio.as_completed([_guarded(symbol) for symbol in symbols]):
+            try:
+                yield await task
+            except Exception as e:
+                logger.error("Error fetching OI data: %s", e)
+
+    async def fetch_multiple_oi_data(self, symbols: List[str],
+                                     max_concurrent: int = 16) -> Dict[str, OISignal]:
+        """
+        Fetch OI data for multiple symbols under a concurrency cap
         """
-        await self.initialize_api_manager()
-        
-        tasks = []
-        for symbol in symbols:
-            task = asyncio.create_task(self.fetch_oi_data(symbol))
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
         oi_data = {}
-        for i, symbol in enumerate(symbols):
-            result = results[i]
-            if not isinstance(result, Exception):
-                oi_data[symbol] = result
-            else:
-                print(f"Error fetching OI data for {symbol}: {result}")
-        
+        async for symbol, result in self.iter_oi_data(symbols, max_concurrent):
+            oi_data[symbol] = result
         return oi_data
     
     def close(self):
@@ -381,117 +718,103 @@ class MockDataFetcher:
     Mock data fetcher for testing without real API calls
     Preserved from the original implementation
     """
-    
+
+    __slots__ = ('api_key', 'secret_key', '_rng')
+
+
     def __init__(self):
         # Don't initialize the real client
         self.api_key = None
         self.secret_key = None
-        print("Initialized MockDataFetcher for testing")
+        self._rng = random.Random()
+        logger.info("Initialized MockDataFetcher for testing")
     
     async def fetch_kline_data(self, symbol: str, interval: str = None, limit: int = None) -> List[KlineData]:
         """
         Generate mock K-line data
         """
-        import random
-        
         interval = interval or get_config('KLINE_INTERVAL')
         limit = limit or get_config('KLINE_LIMIT')
-        
-        # Generate mock data
-        kline_objects = []
-        base_price = 30000 + random.uniform(-5000, 5000)  # Base around $30k
-        
-        for i in range(limit):
-            # Create somewhat realistic price movements
-            open_price = base_price + random.uniform(-100, 100)
-            high = open_price + random.uniform(0, 50)
-            low = open_price - random.uniform(0, 50)
-            close = low + random.uniform(0, high - low)
-            volume = random.uniform(100, 1000)
-            
-            kline_obj = KlineData(
+
+        # Generate mock data in batched array draws instead of per-candle
+        # random.uniform calls
+        rng = np.random.default_rng()
+        base_price = 30000 + rng.uniform(-5000, 5000)  # Base around $30k
+
+        opens = base_price + rng.uniform(-100, 100, limit)
+        highs = opens + rng.uniform(0, 50, limit)
+        lows = opens - rng.uniform(0, 50, limit)
+        closes = lows + rng.uniform(0, 1, limit) * (highs - lows)
+        volumes = rng.uniform(100, 1000, limit)
+        trade_counts = rng.integers(50, 501, limit)
+
+        now_ms = int(time.time() * 1000)
+        open_times = now_ms - np.arange(limit) * 60000
+
+        return [
+            KlineData(
                 symbol=symbol,
-                open_time=int((datetime.now() - timedelta(minutes=i)).timestamp() * 1000),
-                open=open_price,
-                high=high,
-                low=low,
-                close=close,
-                volume=volume,
-                close_time=int((datetime.now() - timedelta(minutes=i)).timestamp() * 1000 + 59999),
-                quote_asset_volume=volume * close,
-                number_of_trades=random.randint(50, 500),
-                taker_buy_base_asset_volume=volume * 0.5,
-                taker_buy_quote_asset_volume=volume * close * 0.5
+                open_time=int(t),
+                open=float(o),
+                high=float(h),
+                low=float(l),
+                close=float(c),
+                volume=float(v),
+                close_time=int(t) + 59999,
+                quote_asset_volume=float(v * c),
+                number_of_trades=int(n),
+                taker_buy_base_asset_volume=float(v * 0.5),
+                taker_buy_quote_asset_volume=float(v * c * 0.5)
             )
-            kline_objects.append(kline_obj)
-        
-        return kline_objects
+            for t, o, h, l, c, v, n in zip(open_times, opens, highs, lows,
+                                           closes, volumes, trade_counts)
+        ]
     
     async def fetch_order_book_depth(self, symbol: str, limit: int = None) -> Optional[OrderBookDepth]:
         """
         Generate mock order book depth data
         """
-        import random
-        
         limit = limit or get_config('ORDER_BOOK_LIMIT')
-        
-        # Generate mock order book
-        current_price = 30000 + random.uniform(-1000, 1000)
-        
-        bids = []
-        asks = []
-        
-        bid_total = 0
-        ask_total = 0
-        
-        bid_cumulative = []
-        ask_cumulative = []
-        
-        for i in range(20):
-            bid_price = current_price - (i + 1) * 5
-            bid_qty = random.uniform(1, 10)
-            bid_total += bid_qty
-            bid_cumulative.append(bid_total)
-            
-            ask_price = current_price + (i + 1) * 5
-            ask_qty = random.uniform(1, 10)
-            ask_total += ask_qty
-            ask_cumulative.append(ask_total)
-            
-            bids.append({'price': bid_price, 'quantity': bid_qty})
-            asks.append({'price': ask_price, 'quantity': ask_qty})
-        
+
+        # Generate mock order book with batched draws and one cumsum per side
+        rng = np.random.default_rng()
+        current_price = 30000 + rng.uniform(-1000, 1000)
+
+        offsets = (np.arange(20) + 1) * 5
+        bid_prices = current_price - offsets
+        ask_prices = current_price + offsets
+        bid_qty = rng.uniform(1, 10, 20)
+        ask_qty = rng.uniform(1, 10, 20)
+        bid_cumulative = np.cumsum(bid_qty)
+        ask_cumulative = np.cumsum(ask_qty)
+
         depth_data = OrderBookDepth(
             symbol=symbol,
             timestamp=datetime.now(),
-            bids=bids,
-            asks=asks,
-            bid_volume=bid_total,
-            ask_volume=ask_total,
+            bids=np.column_stack((bid_prices, bid_qty)),
+            asks=np.column_stack((ask_prices, ask_qty)),
+            bid_volume=float(bid_cumulative[-1]),
+            ask_volume=float(ask_cumulative[-1]),
             bid_cumulative=bid_cumulative,
             ask_cumulative=ask_cumulative,
             spread=10.0,  # 5 * 2 levels
             spread_percentage=(10.0 / current_price) * 100
         )
-        
+
         return depth_data
     
     async def fetch_current_price(self, symbol: str) -> float:
         """
         Generate mock current price
         """
-        import random
-        return 30000 + random.uniform(-1000, 1000)
+        return 30000 + self._rng.uniform(-1000, 1000)
     
     async def fetch_fund_flow(self, symbol: str, limit: int = 100) -> Optional[FundFlow]:
         """
         Generate mock fund flow data
         """
-        import random
-        from .models import SignalDirection
-        
-        buy_volume = random.uniform(1000, 5000)
-        sell_volume = random.uniform(1000, 5000)
+        buy_volume = self._rng.uniform(1000, 5000)
+        sell_volume = self._rng.uniform(1000, 5000)
         total_volume = buy_volume + sell_volume
         
         buy_ratio = buy_volume / total_volume
@@ -508,8 +831,8 @@ class MockDataFetcher:
             buy_ratio=buy_ratio,
             sell_ratio=sell_ratio,
             net_flow=buy_volume - sell_volume,
-            buy_trade_count=random.randint(50, 200),
-            sell_trade_count=random.randint(50, 200),
+            buy_trade_count=self._rng.randint(50, 200),
+            sell_trade_count=self._rng.randint(50, 200),
             flow_direction=flow_direction
         )
         
@@ -519,12 +842,9 @@ class MockDataFetcher:
         """
         Generate mock OI data
         """
-        import random
-        from .models import SignalDirection
-        
         # Simulate OI change
-        magnitude = random.uniform(0, 20)  # 0-20% change
-        direction = SignalDirection.BULLISH if random.random() > 0.5 else SignalDirection.BEARISH
+        magnitude = self._rng.uniform(0, 20)  # 0-20% change
+        direction = SignalDirection.BULLISH if self._rng.random() > 0.5 else SignalDirection.BEARISH
         
         oi_signal = OISignal(
             symbol=symbol,
@@ -4,146 +4,259 @@ Demonstrates the integration of multiple data sources for improved trading signa
 """
 
 import asyncio
-import json
 import logging
 from datetime import datetime
 from typing import Dict, List
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# uvloop is a drop-in event loop 2-4x faster than the default selector
+# loop; Windows and minimal installs fall back silently
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# One generator shared by the simulators; each call draws whole arrays
+# instead of looping over random.uniform
+rng = np.random.default_rng()
+
+# Base prices for the simulated symbols
+_BASE_PRICES = {
+    'BTCUSDT': 45000,
+    'ETHUSDT': 2800,
+    'SOLUSDT': 150,
+    'XRPUSDT': 0.55,
+    'ADAUSDT': 0.45
+}
+
+# Symbols analyzed by the demo
+SYMBOLS = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT']
+
+
+def _final_ewm(x, span):
+    """Last value of a recursive EMA as a single weighted dot product
+
+    The recurrence y_t = (1-a)*y_{t-1} + a*x_t unrolls to a fixed weight
+    vector, so the final value is one np.dot instead of an O(n) loop.
+    """
+    alpha = 2 / (span + 1)
+    n = len(x)
+    w = (1 - alpha) ** np.arange(n - 1, -1, -1)
+    w[1:] *= alpha
+    return w @ x
+
+
+def _ewm_series(x, span):
+    """Full recursive EMA series via a cumulative-sum reformulation
+
+    Rescaling by powers of (1-a) turns the recurrence into one cumsum,
+    replacing the per-element pandas ewm pass.
+    """
+    alpha = 2 / (span + 1)
+    r = 1 - alpha
+    n = len(x)
+    pw = r ** np.arange(n)
+    s = np.empty(n)
+    s[0] = x[0]
+    s[1:] = alpha * x[1:] / pw[1:]
+    np.cumsum(s, out=s)
+    return pw * s
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _rsi_loop(gains, losses, period):
+        """Final RSI via Wilder's smoothing, two scalars of state"""
+        avg_g = 0.0
+        avg_l = 0.0
+        for i in range(period):
+            avg_g += gains[i]
+            avg_l += losses[i]
+        avg_g /= period
+        avg_l /= period
+        for i in range(period, gains.shape[0]):
+            avg_g = (avg_g * (period - 1) + gains[i]) / period
+            avg_l = (avg_l * (period - 1) + losses[i]) / period
+        return 100 - 100 / (1 + avg_g / avg_l)
+else:
+    def _rsi_loop(gains, losses, period):
+        """Final RSI via Wilder's smoothing (numpy fallback without numba)"""
+        avg_g = gains[:period].mean()
+        avg_l = losses[:period].mean()
+        for i in range(period, gains.shape[0]):
+            avg_g = (avg_g * (period - 1) + gains[i]) / period
+            avg_l = (avg_l * (period - 1) + losses[i]) / period
+        return 100 - 100 / (1 + avg_g / avg_l)
+
 
 async def simulate_binance_data(symbol: str) -> Dict:
     """
     Simulate Binance API data since we may not have API keys
+
+    Klines come back as one contiguous (5, N) float64 array with rows
+    open/high/low/close/volume, so indicator code works on row views
+    instead of chasing per-candle dicts.
     """
-    import random
-    
     # Simulate realistic market data
-    base_price = {
-        'BTCUSDT': 45000,
-        'ETHUSDT': 2800,
-        'SOLUSDT': 150,
-        'XRPUSDT': 0.55,
-        'ADAUSDT': 0.45
-    }.get(symbol, 100)
-    
+    base_price = _BASE_PRICES.get(symbol, 100)
+
     # Add some random fluctuation
-    current_price = base_price * (1 + (random.uniform(-0.05, 0.05)))
-    
-    # Generate simulated kline data (last 100 5-min candles)
-    klines = []
-    temp_price = current_price * 0.98  # Start slightly lower
-    for i in range(100):
-        open_price = temp_price
-        change = random.uniform(-0.02, 0.03)  # -2% to +3% change
-        close_price = open_price * (1 + change)
-        high_price = max(open_price, close_price) * (1 + random.uniform(0, 0.02))
-        low_price = min(open_price, close_price) * (1 - random.uniform(0, 0.02))
-        
-        klines.append({
-            'open_time': int(datetime.now().timestamp()) - (99-i)*300,
-            'open': open_price,
-            'high': high_price,
-            'low': low_price,
-            'close': close_price,
-            'volume': random.uniform(100, 1000)
-        })
-        
-        temp_price = close_price
-    
-    # Simulate order book
-    bid_price = current_price * 0.999
-    ask_price = current_price * 1.001
-    
+    current_price = base_price * (1 + rng.uniform(-0.05, 0.05))
+
+    # Generate simulated kline data (last 100 5-min candles) as a
+    # random walk: one cumprod over a batch of draws replaces the
+    # per-candle loop
+    num_klines = 100
+    open_times = int(datetime.now().timestamp()) - 300 * np.arange(num_klines - 1, -1, -1)
+    changes = rng.uniform(-0.02, 0.03, num_klines)  # -2% to +3% change
+    closes = current_price * 0.98 * np.cumprod(1 + changes)  # Start slightly lower
+    opens = np.empty_like(closes)
+    opens[0] = current_price * 0.98
+    opens[1:] = closes[:-1]
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.02, num_klines))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.02, num_klines))
+    volumes = rng.uniform(100, 1000, num_klines)
+    klines = np.stack((opens, highs, lows, closes, volumes))
+
+    # Simulate order book; one np.round pass per column replaces 80
+    # Python-level round calls, lists only materialize at the boundary
+    bid_levels = np.round(current_price * 0.999 * (1 - np.arange(20) * 0.0001), 4)
+    ask_levels = np.round(current_price * 1.001 * (1 + np.arange(20) * 0.0001), 4)
+    bid_sizes = np.round(rng.uniform(1, 10, 20), 2)
+    ask_sizes = np.round(rng.uniform(1, 10, 20), 2)
+
     order_book = {
-        'bids': [[round(bid_price * (1 - i*0.0001), 4), round(random.uniform(1, 10), 2)] for i in range(20)],
-        'asks': [[round(ask_price * (1 + i*0.0001), 4), round(random.uniform(1, 10), 2)] for i in range(20)]
+        'bids': np.column_stack((bid_levels, bid_sizes)).tolist(),
+        'asks': np.column_stack((ask_levels, ask_sizes)).tolist()
     }
-    
+
     return {
         'current_price': current_price,
         'klines': klines,
+        'open_times': open_times,
         'order_book': order_book,
         'symbol': symbol
     }
 
 
-def calculate_technical_indicators(klines: List[Dict]) -> Dict:
+async def simulate_all_binance_data(symbols: List[str]) -> List[Dict]:
     """
-    Calculate technical indicators from kline data
+    Simulate market data for a whole symbol batch at once
+
+    One (n, 100) draw and one axis-1 cumprod produce every symbol's
+    random walk together, instead of n independent per-candle
+    simulations; order books batch the same way.
     """
-    import numpy as np
-    import pandas as pd
-    
-    closes = [k['close'] for k in klines]
-    highs = [k['high'] for k in klines]
-    lows = [k['low'] for k in klines]
-    
+    n = len(symbols)
+    base_prices = np.array([_BASE_PRICES.get(s, 100) for s in symbols], dtype=np.float64)
+    current_prices = base_prices * (1 + rng.uniform(-0.05, 0.05, n))
+
+    num_klines = 100
+    open_times = int(datetime.now().timestamp()) - 300 * np.arange(num_klines - 1, -1, -1)
+    changes = rng.uniform(-0.02, 0.03, (n, num_klines))
+    closes = (current_prices * 0.98)[:, None] * np.cumprod(1 + changes, axis=1)
+    opens = np.empty_like(closes)
+    opens[:, 0] = current_prices * 0.98
+    opens[:, 1:] = closes[:, :-1]
+    highs = np.maximum(opens, closes) * (1 + rng.uniform(0, 0.02, (n, num_klines)))
+    lows = np.minimum(opens, closes) * (1 - rng.uniform(0, 0.02, (n, num_klines)))
+    volumes = rng.uniform(100, 1000, (n, num_klines))
+    klines = np.stack((opens, highs, lows, closes, volumes), axis=1)  # (n, 5, N)
+
+    ladder = np.arange(20) * 0.0001
+    bid_levels = np.round(current_prices[:, None] * 0.999 * (1 - ladder), 4)
+    ask_levels = np.round(current_prices[:, None] * 1.001 * (1 + ladder), 4)
+    bid_sizes = np.round(rng.uniform(1, 10, (n, 20)), 2)
+    ask_sizes = np.round(rng.uniform(1, 10, (n, 20)), 2)
+
+    return [
+        {
+            'current_price': float(current_prices[i]),
+            'klines': klines[i],
+            'open_times': open_times,
+            'order_book': {
+                'bids': np.column_stack((bid_levels[i], bid_sizes[i])).tolist(),
+                'asks': np.column_stack((ask_levels[i], ask_sizes[i])).tolist()
+            },
+            'symbol': symbols[i]
+        }
+        for i in range(n)
+    ]
+
+
+def calculate_technical_indicators(klines: np.ndarray) -> Dict:
+    """
+    Calculate technical indicators from the (5, N) kline array
+
+    Each indicator reads the close row as a view of the shared buffer;
+    no per-candle dicts, intermediate lists, or pandas objects are
+    built anywhere on this path.
+    """
+    closes = klines[3]
+
     # Calculate RSI
     def calculate_rsi(prices, period=14):
+        # Only the final value is reported, so no smoothed arrays are
+        # filled: the recurrence carries two scalars of state
         deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gains = np.zeros_like(gains)
-        avg_losses = np.zeros_like(losses)
-        
-        avg_gains[0:period] = np.mean(gains[0:period])
-        avg_losses[0:period] = np.mean(losses[0:period])
-        
-        for i in range(period, len(gains)):
-            avg_gains[i] = (avg_gains[i-1] * (period-1) + gains[i]) / period
-            avg_losses[i] = (avg_losses[i-1] * (period-1) + losses[i]) / period
-        
-        rs = avg_gains / avg_losses
-        rsi = 100 - (100 / (1 + rs))
-        return rsi[-1] if len(rsi) > 0 else 50
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
+
+        if len(gains) == 0:
+            return 50
+
+        return _rsi_loop(gains, losses, period)
     
     # Calculate MACD
     def calculate_macd(prices, fast=12, slow=26, signal=9):
-        exp1 = pd.Series(prices).ewm(span=fast).mean()
-        exp2 = pd.Series(prices).ewm(span=slow).mean()
-        macd_line = exp1 - exp2
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        
+        x = np.asarray(prices, dtype=np.float64)
+        macd_line = _ewm_series(x, fast) - _ewm_series(x, slow)
+        macd_value = macd_line[-1]
+        signal_value = _final_ewm(macd_line, signal)
+
         return {
-            'macd': macd_line.iloc[-1],
-            'signal': signal_line.iloc[-1],
-            'histogram': histogram.iloc[-1]
+            'macd': macd_value,
+            'signal': signal_value,
+            'histogram': macd_value - signal_value
         }
     
     # Calculate Bollinger Bands
     def calculate_bollinger_bands(prices, period=20, std_dev=2):
-        series = pd.Series(prices)
-        sma = series.rolling(window=period).mean()
-        std = series.rolling(window=period).std()
-        
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        
+        # Only the latest band values are reported, so reduce the last
+        # window directly instead of rolling over the whole series
+        window = prices[-period:]
+        middle = window.mean()
+        band_width = std_dev * window.std(ddof=1)
+
         return {
-            'upper': upper_band.iloc[-1],
-            'middle': sma.iloc[-1],
-            'lower': lower_band.iloc[-1],
+            'upper': middle + band_width,
+            'middle': middle,
+            'lower': middle - band_width,
             'current_price': prices[-1]
         }
-    
+
     # Calculate Moving Averages
     def calculate_moving_averages(prices, periods=[5, 10, 20, 50]):
-        series = pd.Series(prices)
         mas = {}
-        
+
         for period in periods:
             if len(prices) >= period:
-                ma = series.rolling(window=period).mean().iloc[-1]
-                mas[f'ma_{period}'] = ma
+                mas[f'ma_{period}'] = prices[-period:].mean()
             else:
                 mas[f'ma_{period}'] = 0
-        
-        mas['current_price'] = prices[-1] if prices else 0
+
+        mas['current_price'] = prices[-1] if len(prices) else 0
         return mas
     
     rsi = calculate_rsi(closes)
@@ -160,174 +273,256 @@ def calculate_technical_indicators(klines: List[Dict]) -> Dict:
     }
 
 
+# Latest computed indicators per symbol, tagged with the open time of
+# the bar they were computed on
+_ti_cache: Dict[str, tuple] = {}
+
+
+def calculate_technical_indicators_cached(symbol: str, klines: np.ndarray,
+                                          open_times: np.ndarray) -> Dict:
+    """
+    Memoized indicator computation keyed by the latest bar
+
+    In a polling loop the kline history only changes when a new bar
+    opens, so repeated ticks within one bar return the cached dict and
+    only a bar rollover recomputes.
+    """
+    last_open = int(open_times[-1])
+    cached = _ti_cache.get(symbol)
+    if cached is not None and cached[0] == last_open:
+        return cached[1]
+
+    indicators = calculate_technical_indicators(klines)
+    _ti_cache[symbol] = (last_open, indicators)
+    return indicators
+
+
 def get_mock_oi_signals(symbols: List[str]) -> List[Dict]:
     """
     Mock OI (Open Interest) signals similar to what our radar would detect
     """
-    import random
-    
+    # Draw everything for the batch up front; only symbols that pass the
+    # 30% gate get boxed into dicts
+    n = len(symbols)
+    has_signal = rng.random(n) > 0.7
+    directions = rng.random(n) > 0.5
+    scores = np.round(rng.uniform(2.5, 4.0, n), 1)  # Scores similar to our radar
+    two_reasons = rng.random(n) > 0.5
+
     oi_signals = []
-    
-    for symbol in symbols:
-        # Randomly decide if there's an OI signal for this symbol
-        if random.random() > 0.7:  # 30% chance of signal
-            direction = random.choice(['UP', 'DOWN'])
-            score = round(random.uniform(2.5, 4.0), 1)  # Scores similar to our radar
-            
-            oi_signals.append({
-                'symbol': symbol,
-                'score': score,
-                'direction': direction,
-                'timestamp': datetime.now().isoformat(),
-                'reasons': ['vol_spike', 'oi_zscore'] if random.random() > 0.5 else ['vol_spike']
-            })
-    
+    for i in np.flatnonzero(has_signal):
+        oi_signals.append({
+            'symbol': symbols[i],
+            'score': float(scores[i]),
+            'direction': 'UP' if directions[i] else 'DOWN',
+            'timestamp': datetime.now().isoformat(),
+            'reasons': ['vol_spike', 'oi_zscore'] if two_reasons[i] else ['vol_spike']
+        })
+
     return oi_signals
 
 
-def integrate_analysis(symbol: str, tech_indicators: Dict, oi_signals: List[Dict]) -> Dict:
+# Recommendation buckets over the composite score; searchsorted maps a
+# score straight to its label index
+_RECOMMENDATION_BOUNDS = np.array([-0.6, -0.3, 0.3, 0.6])
+_RECOMMENDATION_LABELS = ('STRONG_SELL', 'SELL', 'HOLD', 'BUY', 'STRONG_BUY')
+
+_OI_DIRECTION_SIGNS = {'UP': 1.0, 'DOWN': -1.0}
+
+# Component weights for the composite score: OI, RSI, Bollinger, MACD,
+# trend - OI signals get the highest weight as our primary edge
+_COMPOSITE_WEIGHTS = np.array([0.35, 0.25, 0.20, 0.10, 0.10])
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _integrate_kernel(price, rsi, macd, bb_upper, bb_lower, ma_5, ma_20,
+                          oi_magnitude, oi_sign):
+        """Composite scores, buckets, and risk levels in one native pass"""
+        n = price.shape[0]
+        composite = np.empty(n)
+        rec_idx = np.empty(n, dtype=np.int64)
+        volatility = np.empty(n)
+        stop_loss = np.empty(n)
+        take_profit = np.empty(n)
+        for i in range(n):
+            span = bb_upper[i] - bb_lower[i]
+            if span != 0:
+                bb_position = (price[i] - bb_lower[i]) / span
+                bb_position = max(0.0, min(1.0, bb_position))
+            else:
+                bb_position = 0.5
+
+            if rsi[i] < 30:
+                rsi_score = 0.8
+            elif rsi[i] > 70:
+                rsi_score = -0.8
+            elif 40 <= rsi[i] <= 60:
+                rsi_score = 0.0
+            elif rsi[i] < 50:
+                rsi_score = 0.4
+            else:
+                rsi_score = -0.4
+
+            macd_score = 1.0 if macd[i] > 0.001 else -1.0 if macd[i] < -0.001 else 0.0
+
+            if bb_position < 0.2:
+                bb_score = 0.7
+            elif bb_position > 0.8:
+                bb_score = -0.7
+            elif 0.4 <= bb_position <= 0.6:
+                bb_score = 0.0
+            elif bb_position < 0.5:
+                bb_score = 0.3
+            else:
+                bb_score = -0.3
+
+            if price[i] > ma_5[i] > ma_20[i]:
+                trend_score = 0.6
+            elif price[i] < ma_5[i] < ma_20[i]:
+                trend_score = -0.6
+            elif ma_5[i] > ma_20[i]:
+                trend_score = 0.3
+            elif ma_5[i] < ma_20[i]:
+                trend_score = -0.3
+            else:
+                trend_score = 0.0
+
+            oi_score = oi_sign[i] * min(1.0, oi_magnitude[i] / 4.0)
+
+            c = (0.35 * oi_score + 0.25 * rsi_score + 0.20 * bb_score +
+                 0.10 * macd_score + 0.10 * trend_score)
+            composite[i] = c
+
+            if c < -0.6:
+                rec_idx[i] = 0
+            elif c < -0.3:
+                rec_idx[i] = 1
+            elif c < 0.3:
+                rec_idx[i] = 2
+            elif c < 0.6:
+                rec_idx[i] = 3
+            else:
+                rec_idx[i] = 4
+
+            vol = abs(rsi[i] - 50) / 50 + 0.02
+            volatility[i] = vol
+            stop_pct = 2.0 * vol
+            if rec_idx[i] >= 3:
+                stop_loss[i] = price[i] * (1 - stop_pct)
+                take_profit[i] = price[i] * (1 + 2 * stop_pct)
+            else:
+                stop_loss[i] = price[i] * (1 + stop_pct)
+                take_profit[i] = price[i] * (1 - 2 * stop_pct)
+        return composite, rec_idx, volatility, stop_loss, take_profit
+else:
+    def _integrate_kernel(price, rsi, macd, bb_upper, bb_lower, ma_5, ma_20,
+                          oi_magnitude, oi_sign):
+        """Composite scores, buckets, and risk levels, vectorized
+
+        Each scoring cascade runs as one branchless np.select over the
+        batch; conditions are evaluated in cascade order and the
+        default catches the final branch.
+        """
+        # BB position clamped to [0, 1]; degenerate bands read as neutral
+        bb_span = bb_upper - bb_lower
+        bb_position = np.where(
+            bb_span != 0,
+            np.clip((price - bb_lower) / np.where(bb_span != 0, bb_span, 1.0), 0, 1),
+            0.5
+        )
+
+        rsi_score = np.select(
+            [rsi < 30, rsi > 70, (rsi >= 40) & (rsi <= 60), rsi < 50],
+            [0.8, -0.8, 0.0, 0.4], default=-0.4
+        )
+        macd_score = np.select([macd > 0.001, macd < -0.001], [1.0, -1.0], default=0.0)
+        bb_score = np.select(
+            [bb_position < 0.2, bb_position > 0.8,
+             (bb_position >= 0.4) & (bb_position <= 0.6), bb_position < 0.5],
+            [0.7, -0.7, 0.0, 0.3], default=-0.3
+        )
+        trend_score = np.select(
+            [(price > ma_5) & (ma_5 > ma_20), (price < ma_5) & (ma_5 < ma_20),
+             ma_5 > ma_20, ma_5 < ma_20],
+            [0.6, -0.6, 0.3, -0.3], default=0.0
+        )
+        oi_score = oi_sign * np.minimum(1.0, oi_magnitude / 4.0)
+
+        # One (5, N) matrix-vector product applies all the component
+        # weights at once; rounding far below signal resolution keeps
+        # BLAS accumulation-order noise from flipping an exact bucket
+        # boundary like -0.3
+        scores = np.stack((oi_score, rsi_score, bb_score, macd_score, trend_score))
+        composite = np.round(_COMPOSITE_WEIGHTS @ scores, 12)
+
+        rec_idx = np.searchsorted(_RECOMMENDATION_BOUNDS, composite, side='right')
+
+        volatility = np.abs(rsi - 50) / 50 + 0.02
+        stop_pct = 2.0 * volatility
+        long_mask = rec_idx >= 3
+        stop_loss = np.where(long_mask, price * (1 - stop_pct), price * (1 + stop_pct))
+        take_profit = np.where(long_mask, price * (1 + 2 * stop_pct), price * (1 - 2 * stop_pct))
+        return composite, rec_idx, volatility, stop_loss, take_profit
+
+
+def integrate_analysis_batch(symbols: List[str], tech_indicators_list: List[Dict],
+                             oi_by_symbol: Dict) -> List[Dict]:
     """
-    Integrate technical indicators with OI signals to generate trading recommendation
+    Integrate technical indicators with OI signals for a whole batch
+
+    Inputs are gathered into per-component arrays and scored in one
+    _integrate_kernel pass - compiled by numba where available,
+    np.select otherwise; dicts are only boxed at the output boundary.
     """
-    # Find OI signal for this symbol
-    symbol_oi_signal = None
-    for signal in oi_signals:
-        if signal.get('symbol') == symbol:
-            symbol_oi_signal = signal
-            break
-    
-    # Extract values
-    current_price = tech_indicators.get('current_price', 0)
-    rsi = tech_indicators.get('rsi', 50)
-    macd = tech_indicators.get('macd', {}).get('macd', 0)
-    bb_data = tech_indicators.get('bollinger_bands', {})
-    
-    # Calculate BB position
-    if bb_data:
-        bb_upper = bb_data.get('upper', 0)
-        bb_lower = bb_data.get('lower', 0)
-        
-        if bb_upper != bb_lower:
-            bb_position = (current_price - bb_lower) / (bb_upper - bb_lower)
-            bb_position = max(0, min(1, bb_position))  # Clamp between 0 and 1
-        else:
-            bb_position = 0.5
-    else:
-        bb_position = 0.5
-    
-    # Calculate trend score from moving averages
-    ma_data = tech_indicators.get('moving_averages', {})
-    ma_5 = ma_data.get('ma_5', 0)
-    ma_20 = ma_data.get('ma_20', 0)
-    
-    if current_price > ma_5 > ma_20:
-        trend_score = 0.6  # Bullish trend
-    elif current_price < ma_5 < ma_20:
-        trend_score = -0.6  # Bearish trend
-    elif ma_5 > ma_20:
-        trend_score = 0.3  # Mildly bullish
-    elif ma_5 < ma_20:
-        trend_score = -0.3  # Mildly bearish
-    else:
-        trend_score = 0  # Neutral
-    
-    # Incorporate OI signals if available
-    oi_magnitude = symbol_oi_signal.get('score', 0) if symbol_oi_signal else 0
-    oi_direction = symbol_oi_signal.get('direction', 'NEUTRAL') if symbol_oi_signal else 'NEUTRAL'
-    
-    # Calculate individual component scores
-    # RSI score: bullish when oversold (<30), bearish when overbought (>70)
-    if rsi < 30:
-        rsi_score = 0.8  # Very bullish (oversold)
-    elif rsi > 70:
-        rsi_score = -0.8  # Very bearish (overbought)
-    elif 40 <= rsi <= 60:
-        rsi_score = 0  # Neutral
-    else:
-        # Between 30-40 (slightly bullish) or 60-70 (slightly bearish)
-        rsi_score = 0.4 if rsi < 50 else -0.4
-    
-    # MACD score
-    macd_score = 1 if macd > 0.001 else -1 if macd < -0.001 else 0
-    
-    # Bollinger Band score: bullish when near/below lower band, bearish when near/above upper band
-    if bb_position < 0.2:
-        bb_score = 0.7  # Near lower band - bullish
-    elif bb_position > 0.8:
-        bb_score = -0.7  # Near upper band - bearish
-    elif 0.4 <= bb_position <= 0.6:
-        bb_score = 0  # Middle - neutral
-    else:
-        # Between neutral and bands - mild signals
-        bb_score = 0.3 if bb_position < 0.5 else -0.3
-    
-    # OI score: weighted heavily as our primary signal
-    if oi_direction == 'UP':
-        oi_score = min(1.0, oi_magnitude / 4.0)  # Normalize to 0-1 range
-    elif oi_direction == 'DOWN':
-        oi_score = -min(1.0, oi_magnitude / 4.0)
-    else:
-        oi_score = 0
-    
-    # Weighted composite score
-    # OI signals get highest weight as they're our primary edge
-    composite_score = (
-        0.35 * oi_score +      # 35% weight to OI signals
-        0.25 * rsi_score +     # 25% weight to RSI
-        0.20 * bb_score +      # 20% weight to Bollinger Bands
-        0.10 * macd_score +    # 10% weight to MACD
-        0.10 * trend_score     # 10% weight to trend
+    oi_signals = [oi_by_symbol.get(symbol) for symbol in symbols]
+
+    # Gather scalar inputs into per-component arrays
+    price = np.array([t.get('current_price', 0) for t in tech_indicators_list], dtype=np.float64)
+    rsi = np.array([t.get('rsi', 50) for t in tech_indicators_list], dtype=np.float64)
+    macd = np.array([t.get('macd', {}).get('macd', 0) for t in tech_indicators_list], dtype=np.float64)
+    bb_upper = np.array([t.get('bollinger_bands', {}).get('upper', 0) for t in tech_indicators_list], dtype=np.float64)
+    bb_lower = np.array([t.get('bollinger_bands', {}).get('lower', 0) for t in tech_indicators_list], dtype=np.float64)
+    ma_5 = np.array([t.get('moving_averages', {}).get('ma_5', 0) for t in tech_indicators_list], dtype=np.float64)
+    ma_20 = np.array([t.get('moving_averages', {}).get('ma_20', 0) for t in tech_indicators_list], dtype=np.float64)
+    oi_magnitude = np.array([s.get('score', 0) if s else 0 for s in oi_signals], dtype=np.float64)
+    oi_sign = np.array([_OI_DIRECTION_SIGNS.get(s.get('direction'), 0.0) if s else 0.0
+                        for s in oi_signals], dtype=np.float64)
+
+    composite, rec_idx, volatility, stop_loss, take_profit = _integrate_kernel(
+        price, rsi, macd, bb_upper, bb_lower, ma_5, ma_20, oi_magnitude, oi_sign
     )
-    
-    # Generate recommendation
-    if composite_score >= 0.6:
-        recommendation = 'STRONG_BUY'
-    elif composite_score >= 0.3:
-        recommendation = 'BUY'
-    elif composite_score >= -0.3:
-        recommendation = 'HOLD'
-    elif composite_score >= -0.6:
-        recommendation = 'SELL'
-    else:
-        recommendation = 'STRONG_SELL'
-    
-    # Calculate risk management
-    # Simple calculation based on recommendation
-    volatility_estimate = abs(rsi - 50) / 50 + 0.02  # Base volatility estimate
-    
-    if 'BUY' in recommendation:
-        # For long positions
-        stop_loss_pct = 2.0 * volatility_estimate  # 2% of estimated volatility
-        take_profit_pct = stop_loss_pct * 2  # 1:2 risk-reward ratio
-        
-        stop_loss = round(current_price * (1 - stop_loss_pct), 6)
-        take_profit = round(current_price * (1 + take_profit_pct), 6)
-    elif 'SELL' in recommendation:
-        # For short positions
-        stop_loss_pct = 2.0 * volatility_estimate
-        take_profit_pct = stop_loss_pct * 2
-        
-        stop_loss = round(current_price * (1 + stop_loss_pct), 6)
-        take_profit = round(current_price * (1 - take_profit_pct), 6)
-    else:
-        # For HOLD, no specific stop loss/take profit
-        stop_loss = None
-        take_profit = None
-    
-    return {
-        'symbol': symbol,
-        'current_price': current_price,
-        'composite_score': round(composite_score, 3),
-        'recommendation': recommendation,
-        'confidence_level': round(abs(composite_score) * 100, 1),
-        'technical_indicators': tech_indicators,
-        'oi_signal': symbol_oi_signal,
-        'risk_management': {
-            'stop_loss': stop_loss,
-            'take_profit': take_profit,
-            'estimated_volatility': round(volatility_estimate * 100, 2)
-        }
-    }
+
+    results = []
+    for i, symbol in enumerate(symbols):
+        directional = rec_idx[i] != 2
+        results.append({
+            'symbol': symbol,
+            'current_price': price[i],
+            'composite_score': round(float(composite[i]), 3),
+            'recommendation': _RECOMMENDATION_LABELS[rec_idx[i]],
+            'confidence_level': round(abs(float(composite[i])) * 100, 1),
+            'technical_indicators': tech_indicators_list[i],
+            'oi_signal': oi_signals[i],
+            'risk_management': {
+                'stop_loss': round(float(stop_loss[i]), 6) if directional else None,
+                'take_profit': round(float(take_profit[i]), 6) if directional else None,
+                'estimated_volatility': round(float(volatility[i]) * 100, 2)
+            }
+        })
+    return results
+
+
+def integrate_analysis(symbol: str, tech_indicators: Dict, oi_by_symbol: Dict) -> Dict:
+    """
+    Integrate technical indicators with OI signals for one symbol
+
+    Thin wrapper over the batch path so the scoring logic lives in one
+    place.
+    """
+    return integrate_analysis_batch([symbol], [tech_indicators], oi_by_symbol)[0]
+
+
 
 
 async def main():
@@ -340,7 +535,7 @@ async def main():
     print("=" * 70)
     
     # Define symbols to analyze
-    symbols = ['BTCUSDT', 'ETHUSDT', 'SOLUSDT', 'XRPUSDT', 'ADAUSDT']
+    symbols = SYMBOLS
     
     # Get mock OI signals
     oi_signals = get_mock_oi_signals(symbols)
@@ -351,22 +546,22 @@ async def main():
     
     print(f"\n📈 Analyzing {len(symbols)} symbols...")
     
-    # Analyze each symbol
-    results = []
-    for symbol in symbols:
-        print(f"\n--- Analyzing {symbol} ---")
-        
-        # Get simulated market data
-        market_data = await simulate_binance_data(symbol)
-        
-        # Calculate technical indicators
-        tech_indicators = calculate_technical_indicators(market_data['klines'])
-        
-        # Integrate with OI signals
-        analysis = integrate_analysis(symbol, tech_indicators, oi_signals)
-        
-        results.append(analysis)
-        
+    # Index the OI signals by symbol once for O(1) lookups downstream
+    oi_by_symbol = {signal['symbol']: signal for signal in oi_signals}
+
+    # Simulate the whole batch in one vectorized draw, then score it in
+    # one vectorized integration pass
+    market_data_list = await simulate_all_binance_data(symbols)
+    tech_indicators_list = [
+        calculate_technical_indicators_cached(md['symbol'], md['klines'], md['open_times'])
+        for md in market_data_list
+    ]
+    results = integrate_analysis_batch(symbols, tech_indicators_list, oi_by_symbol)
+
+    for analysis in results:
+        print(f"\n--- Analyzing {analysis['symbol']} ---")
+        tech_indicators = analysis['technical_indicators']
+
         # Display results
         print(f"Current Price: ${analysis['current_price']:.4f}")
         print(f"Composite Score: {analysis['composite_score']}")
@@ -4,25 +4,30 @@ Demonstrates integration of all components with real API connectivity
 """
 
 import asyncio
-import json
+import random
 from datetime import datetime
 
 from .trading_system import EnhancedTradingSystem
-from .api_integration import get_api_manager, get_symbol_data, get_multiple_symbols_data_cached
+from .api_integration import (get_api_manager, get_symbol_data,
+                              get_multiple_symbols_data_cached, cleanup_api_resources)
 from .config import get_config, validate_config
 from .utils import generate_signal_summary
 
+# uvloop is a drop-in event loop 2-4x faster than the default selector
+# loop; Windows and minimal installs fall back silently
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-async def example_basic_usage():
+
+async def example_basic_usage(trading_system: EnhancedTradingSystem):
     """
     Example of basic usage of the trading system
     """
     print("=== BASIC USAGE EXAMPLE ===")
-    
-    # Initialize the trading system
-    trading_system = EnhancedTradingSystem()
-    await trading_system.initialize_async_client()
-    
+
     # Define symbols to analyze
     symbols = ['BTCUSDT', 'ETHUSDT']
     
@@ -54,7 +59,7 @@ async def example_basic_usage():
     print("\nBasic usage example completed.\n")
 
 
-async def example_detailed_analysis():
+async def example_detailed_analysis(trading_system: EnhancedTradingSystem):
     """
     Example of detailed analysis with individual component usage
     """
@@ -71,9 +76,6 @@ async def example_detailed_analysis():
     print(f"Current price: {market_data.get('price', 'N/A')}")
     
     # Get technical indicators
-    trading_system = EnhancedTradingSystem()
-    await trading_system.initialize_async_client()
-    
     tech_indicators = await trading_system.get_technical_indicators(symbol)
     if tech_indicators:
         print(f"RSI: {tech_indicators.get('rsi', 'N/A')}")
@@ -89,7 +91,7 @@ async def example_detailed_analysis():
     print("\nDetailed analysis example completed.\n")
 
 
-async def example_multi_symbol_monitoring():
+async def example_multi_symbol_monitoring(trading_system: EnhancedTradingSystem):
     """
     Example of monitoring multiple symbols simultaneously
     """
@@ -109,14 +111,9 @@ async def example_multi_symbol_monitoring():
         
         print(f"  {symbol}: ${price} ({price_change}%)")
     
-    # Generate comprehensive signals for all symbols
-    trading_system = EnhancedTradingSystem()
-    await trading_system.initialize_async_client()
-    
     # Create mock OI signals for this example
     oi_signals = {}
     for symbol in symbols:
-        import random
         oi_signals[symbol] = {
             'magnitude': random.uniform(5, 15),
             'direction': 'BULLISH' if random.random() > 0.5 else 'BEARISH',
@@ -134,15 +131,12 @@ async def example_multi_symbol_monitoring():
     print("\nMulti-symbol monitoring example completed.\n")
 
 
-async def example_risk_management():
+async def example_risk_management(trading_system: EnhancedTradingSystem):
     """
     Example demonstrating the risk management features
     """
     print("=== RISK MANAGEMENT EXAMPLE ===")
-    
-    trading_system = EnhancedTradingSystem()
-    await trading_system.initialize_async_client()
-    
+
     symbol = 'BTCUSDT'
     
     # Get current price
@@ -167,16 +161,12 @@ async def example_risk_management():
     print("\nRisk management example completed.\n")
 
 
-async def example_comprehensive_workflow():
+async def example_comprehensive_workflow(trading_system: EnhancedTradingSystem):
     """
     Complete workflow example combining all system components
     """
     print("=== COMPREHENSIVE WORKFLOW EXAMPLE ===")
-    
-    # Initialize components
-    trading_system = EnhancedTradingSystem()
-    await trading_system.initialize_async_client()
-    
+
     # Define universe of symbols to monitor
     symbols = get_config('DEFAULT_SYMBOLS', ['BTCUSDT', 'ETHUSDT'])
     print(f"Monitoring universe: {symbols[:5]}...")  # Show first 5
@@ -185,25 +175,24 @@ async def example_comprehensive_workflow():
     print("\n1. Fetching market data...")
     market_data = await get_multiple_symbols_data_cached(symbols[:5])  # Limit for example
     
-    # Step 2: Analyze technicals for each symbol
+    # Step 2: Analyze technicals for each symbol concurrently
     print("2. Analyzing technical indicators...")
-    technical_data = {}
-    for symbol in symbols[:5]:
-        tech = await trading_system.get_technical_indicators(symbol)
-        technical_data[symbol] = tech
-    
-    # Step 3: Perform fund flow analysis
+    tech_results = await asyncio.gather(
+        *(trading_system.get_technical_indicators(symbol) for symbol in symbols[:5])
+    )
+    technical_data = dict(zip(symbols[:5], tech_results))
+
+    # Step 3: Perform fund flow analysis concurrently
     print("3. Analyzing fund flows...")
-    fund_flow_data = {}
-    for symbol in symbols[:5]:
-        flow = await trading_system.analyze_fund_flow(symbol)
-        fund_flow_data[symbol] = flow
+    flow_results = await asyncio.gather(
+        *(trading_system.analyze_fund_flow(symbol) for symbol in symbols[:5])
+    )
+    fund_flow_data = dict(zip(symbols[:5], flow_results))
     
     # Step 4: Generate integrated signals (with mock OI signals)
     print("4. Generating integrated signals...")
     oi_signals = {}
     for symbol in symbols[:5]:
-        import random
         oi_signals[symbol] = {
             'magnitude': random.uniform(3, 20),
             'direction': 'BULLISH' if random.random() > 0.4 else 'BEARISH',
@@ -232,13 +221,22 @@ async def run_all_examples():
     print("=" * 60)
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
-    
+
+    # One client shared by every example: a single aiohttp session and
+    # connection pool instead of five init/teardown cycles
+    trading_system = EnhancedTradingSystem()
+    await trading_system.initialize_async_client()
+
     try:
-        await example_basic_usage()
-        await example_detailed_analysis()
-        await example_multi_symbol_monitoring()
-        await example_risk_management()
-        await example_comprehensive_workflow()
+        # Pre-warm the shared cache with every symbol the examples touch
+        # so the per-example calls below dedupe into cache hits
+        await get_multiple_symbols_data_cached(['BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT'])
+
+        await example_basic_usage(trading_system)
+        await example_detailed_analysis(trading_system)
+        await example_multi_symbol_monitoring(trading_system)
+        await example_risk_management(trading_system)
+        await example_comprehensive_workflow(trading_system)
         
         print("=" * 60)
         print("ALL EXAMPLES COMPLETED SUCCESSFULLY!")
@@ -249,10 +247,10 @@ async def run_all_examples():
         print(f"Error during examples: {e}")
         import traceback
         traceback.print_exc()
-    
-    # Cleanup
-    from .api_integration import cleanup_api_resources
-    await cleanup_api_resources()
+
+    finally:
+        # Cleanup
+        await cleanup_api_resources()
 
 
 if __name__ == "__main__":
@@ -3,13 +3,133 @@ Improved Data Fetcher using the new API Integration Module
 """
 
 import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
+
 from .api_integration import get_api_manager, get_symbol_data, get_multiple_symbols_data_cached, get_technical_data_cached
-from .models import KlineData, OrderBookDepth, FundFlow, OISignal
+from .models import KlineData, KlineBatch, OrderBookDepth, FundFlow, OISignal, SignalDirection
 from .config import get_config
-from .utils import safe_float_conversion
+
+logger = logging.getLogger(__name__)
+
+# Route this module's records through a queue so formatting and stdout
+# writes happen on the listener thread, not the event loop
+if not logger.handlers:
+    _log_queue = SimpleQueue()
+    logger.addHandler(QueueHandler(_log_queue))
+    # Keep records off the root handler installed by basicConfig so
+    # they are emitted once, by the listener
+    logger.propagate = False
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _cum_and_totals(qty):
+        """Prefix sums plus grand total for one order book side"""
+        cumulative = np.empty_like(qty)
+        total = 0.0
+        for i in range(qty.shape[0]):
+            total += qty[i]
+            cumulative[i] = total
+        return cumulative, total
+else:
+    def _cum_and_totals(qty: np.ndarray):
+        """Prefix sums plus grand total for one order book side"""
+        cumulative = np.cumsum(qty)
+        total = float(cumulative[-1]) if len(cumulative) > 0 else 0.0
+        return cumulative, total
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _ff_reduce(q, m):
+        """One-pass buy/sell volume and count reduction over a trade batch"""
+        bv = 0.0
+        sv = 0.0
+        bc = 0
+        sc = 0
+        for i in range(q.size):
+            if m[i]:
+                bv += q[i]
+                bc += 1
+            else:
+                sv += q[i]
+                sc += 1
+        return bv, sv, bc, sc
+else:
+    def _ff_reduce(q: np.ndarray, m: np.ndarray):
+        """One-pass buy/sell volume and count reduction over a trade batch"""
+        bc = int(np.count_nonzero(m))
+        return float(q[m].sum()), float(q[~m].sum()), bc, len(m) - bc
+
+
+def _klines_raw_to_objects(symbol: str, raw_klines: List) -> List[KlineData]:
+    """Convert raw kline rows to KlineData via columnwise casts
+
+    One astype per column group replaces the per-row
+    safe_float_conversion calls of the old loop.
+    """
+    if not raw_klines:
+        return []
+
+    arr = np.asarray([k[:11] for k in raw_klines], dtype=object)
+    floats = arr[:, [1, 2, 3, 4, 5, 7, 9, 10]].astype(np.float64)
+    ints = arr[:, [0, 6, 8]].astype(np.int64)
+
+    return [
+        KlineData(
+            symbol=symbol,
+            open_time=int(ints[i, 0]),
+            open=floats[i, 0],
+            high=floats[i, 1],
+            low=floats[i, 2],
+            close=floats[i, 3],
+            volume=floats[i, 4],
+            close_time=int(ints[i, 1]),
+            quote_asset_volume=floats[i, 5],
+            number_of_trades=int(ints[i, 2]),
+            taker_buy_base_asset_volume=floats[i, 6],
+            taker_buy_quote_asset_volume=floats[i, 7]
+        )
+        for i in range(arr.shape[0])
+    ]
+
+
+def _klines_raw_to_batch(symbol: str, raw_klines: List) -> KlineBatch:
+    """Convert raw kline rows to a columnar KlineBatch"""
+    if raw_klines:
+        arr = np.asarray([k[:11] for k in raw_klines], dtype=object)
+        floats = arr[:, [1, 2, 3, 4, 5, 7, 9, 10]].astype(np.float64)
+        ints = arr[:, [0, 6, 8]].astype(np.int64)
+    else:
+        floats = np.empty((0, 8), dtype=np.float64)
+        ints = np.empty((0, 3), dtype=np.int64)
+
+    return KlineBatch(
+        symbol=symbol,
+        open_time=ints[:, 0],
+        open=floats[:, 0],
+        high=floats[:, 1],
+        low=floats[:, 2],
+        close=floats[:, 3],
+        volume=floats[:, 4],
+        close_time=ints[:, 1],
+        quote_asset_volume=floats[:, 5],
+        number_of_trades=ints[:, 2],
+        taker_buy_base_asset_volume=floats[:, 6],
+        taker_buy_quote_asset_volume=floats[:, 7]
+    )
 
 
 class ImprovedDataFetcher:
@@ -19,6 +139,14 @@ class ImprovedDataFetcher:
     
     def __init__(self):
         self.api_manager = None
+        # Snapshot the hot-path config once; the polling loop would
+        # otherwise repeat these lookups on every fetch of every symbol
+        self._kline_interval = get_config('KLINE_INTERVAL')
+        self._kline_limit = get_config('KLINE_LIMIT')
+        self._order_book_limit = get_config('ORDER_BOOK_LIMIT')
+        # One Generator per fetcher beats per-call random.* lookups and
+        # can batch draws when a whole symbol list is simulated at once
+        self._rng = np.random.default_rng()
     
     async def initialize(self):
         """Initialize the API manager"""
@@ -31,93 +159,125 @@ class ImprovedDataFetcher:
         """
         await self.initialize()
         
-        interval = interval or get_config('KLINE_INTERVAL')
-        limit = limit or get_config('KLINE_LIMIT')
+        interval = interval or self._kline_interval
+        limit = limit or self._kline_limit
         
         try:
             # Use the cached technical data function
             tech_data = await get_technical_data_cached(symbol, interval, limit)
-            raw_klines = tech_data.get('klines', [])
-            
-            kline_objects = []
-            for kline in raw_klines:
-                kline_obj = KlineData(
-                    symbol=symbol,
-                    open_time=kline[0],
-                    open=safe_float_conversion(kline[1]),
-                    high=safe_float_conversion(kline[2]),
-                    low=safe_float_conversion(kline[3]),
-                    close=safe_float_conversion(kline[4]),
-                    volume=safe_float_conversion(kline[5]),
-                    close_time=kline[6],
-                    quote_asset_volume=safe_float_conversion(kline[7]),
-                    number_of_trades=kline[8],
-                    taker_buy_base_asset_volume=safe_float_conversion(kline[9]),
-                    taker_buy_quote_asset_volume=safe_float_conversion(kline[10])
-                )
-                kline_objects.append(kline_obj)
-            
-            return kline_objects
-            
+            return _klines_raw_to_objects(symbol, tech_data.get('klines', []))
+
         except Exception as e:
-            print(f"Error fetching kline data for {symbol}: {e}")
+            logger.warning("Error fetching kline data for %s: %s", symbol, e)
             return []
-    
-    async def fetch_order_book_depth(self, symbol: str, limit: int = None) -> Optional[OrderBookDepth]:
+
+    async def fetch_kline_batch(self, symbol: str, interval: str = None, limit: int = None) -> KlineBatch:
+        """
+        Fetch K-line data as a columnar KlineBatch
+
+        Indicator and backtest code can run vectorized over the column
+        arrays; fetch_kline_data remains for per-candle consumers.
+        """
+        await self.initialize()
+
+        interval = interval or self._kline_interval
+        limit = limit or self._kline_limit
+
+        try:
+            tech_data = await get_technical_data_cached(symbol, interval, limit)
+            return _klines_raw_to_batch(symbol, tech_data.get('klines', []))
+
+        except Exception as e:
+            logger.warning("Error fetching kline batch for %s: %s", symbol, e)
+            return _klines_raw_to_batch(symbol, [])
+
+    async def fetch_kline_data_df(self, symbol: str, interval: str = None, limit: int = None) -> pd.DataFrame:
+        """
+        Fetch K-line data as a typed DataFrame
+
+        The whole raw batch goes through one DataFrame constructor and
+        two columnwise astype calls instead of N per-row object builds.
+        """
+        await self.initialize()
+
+        interval = interval or self._kline_interval
+        limit = limit or self._kline_limit
+
+        cols = ['open_time', 'open', 'high', 'low', 'close', 'volume',
+                'close_time', 'quote_asset_volume', 'number_of_trades',
+                'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume']
+        float_cols = ['open', 'high', 'low', 'close', 'volume',
+                      'quote_asset_volume', 'taker_buy_base_asset_volume',
+                      'taker_buy_quote_asset_volume']
+
+        try:
+            tech_data = await get_technical_data_cached(symbol, interval, limit)
+            raw_klines = tech_data.get('klines', [])
+
+            df = pd.DataFrame((k[:11] for k in raw_klines), columns=cols)
+            if len(df):
+                df[float_cols] = df[float_cols].astype(np.float64)
+                df[['open_time', 'close_time', 'number_of_trades']] = \
+                    df[['open_time', 'close_time', 'number_of_trades']].astype(np.int64)
+            df.insert(0, 'symbol', symbol)
+            return df
+
+        except Exception as e:
+            logger.warning("Error fetching kline frame for %s: %s", symbol, e)
+            return pd.DataFrame(columns=['symbol'] + cols)
+
+    async def fetch_order_book_depth(self, symbol: str, limit: int = None,
+                                     market_data: Dict = None,
+                                     tick_ts: datetime = None) -> Optional[OrderBookDepth]:
         """
         Fetch order book depth data using the new API integration
+
+        Callers that already hold the symbol's market data can pass it in
+        to skip the redundant upstream fetch; tick_ts lets one clock read
+        be shared across every fetch of the same tick.
         """
         await self.initialize()
-        
-        limit = limit or get_config('ORDER_BOOK_LIMIT')
-        
+
+        limit = limit or self._order_book_limit
+
         try:
             # Get market data which includes order book
-            market_data = await get_symbol_data(symbol)
+            if market_data is None:
+                market_data = await get_symbol_data(symbol)
             order_book = market_data.get('order_book', {})
             
             if not order_book:
-                print(f"No order book data available for {symbol}")
+                logger.warning("No order book data available for %s", symbol)
                 return None
             
-            # Process bids and asks
-            bids = [(safe_float_conversion(price), safe_float_conversion(qty)) 
-                   for price, qty in order_book.get('bids', [])]
-            asks = [(safe_float_conversion(price), safe_float_conversion(qty)) 
-                   for price, qty in order_book.get('asks', [])]
-            
-            # Calculate cumulative volumes
-            bid_cumulative = []
-            ask_cumulative = []
-            
-            running_bid_sum = 0
-            running_ask_sum = 0
-            
-            for _, qty in bids:
-                running_bid_sum += qty
-                bid_cumulative.append(running_bid_sum)
-            
-            for _, qty in asks:
-                running_ask_sum += qty
-                ask_cumulative.append(running_ask_sum)
-            
+            # One vectorized cast per side replaces the tuple-list walk;
+            # cumulative volumes and side totals come from one compiled pass
+            bids_arr = np.asarray(order_book.get('bids', []), dtype=np.float64).reshape(-1, 2)
+            asks_arr = np.asarray(order_book.get('asks', []), dtype=np.float64).reshape(-1, 2)
+
+            bid_cumulative, bid_volume = _cum_and_totals(bids_arr[:, 1])
+            ask_cumulative, ask_volume = _cum_and_totals(asks_arr[:, 1])
+
+            has_both_sides = len(bids_arr) > 0 and len(asks_arr) > 0
+            spread = float(asks_arr[0, 0] - bids_arr[0, 0]) if has_both_sides else 0
+
             depth_data = OrderBookDepth(
                 symbol=symbol,
-                timestamp=market_data.get('timestamp', datetime.now()),
-                bids=[{'price': price, 'quantity': qty} for price, qty in bids[:20]],
-                asks=[{'price': price, 'quantity': qty} for price, qty in asks[:20]],
-                bid_volume=sum([qty for _, qty in bids]),
-                ask_volume=sum([qty for _, qty in asks]),
+                timestamp=market_data.get('timestamp') or tick_ts or datetime.now(),
+                bids=bids_arr[:20],
+                asks=asks_arr[:20],
+                bid_volume=bid_volume,
+                ask_volume=ask_volume,
                 bid_cumulative=bid_cumulative[:20],
                 ask_cumulative=ask_cumulative[:20],
-                spread=(asks[0][0] - bids[0][0]) if bids and asks else 0,
-                spread_percentage=((asks[0][0] - bids[0][0]) / bids[0][0] * 100) if bids and asks else 0
+                spread=spread,
+                spread_percentage=(spread / bids_arr[0, 0] * 100) if has_both_sides else 0
             )
             
             return depth_data
             
         except Exception as e:
-            print(f"Error fetching order book depth for {symbol}: {e}")
+            logger.warning("Error fetching order book depth for %s: %s", symbol, e)
             return None
     
     async def fetch_current_price(self, symbol: str) -> float:
@@ -130,7 +290,7 @@ class ImprovedDataFetcher:
             market_data = await get_symbol_data(symbol)
             return market_data.get('price', 0.0)
         except Exception as e:
-            print(f"Error fetching current price for {symbol}: {e}")
+            logger.warning("Error fetching current price for %s: %s", symbol, e)
             return 0.0
     
     async def fetch_multiple_symbols_data(self, symbols: List[str]) -> Dict[str, Dict]:
@@ -143,10 +303,11 @@ class ImprovedDataFetcher:
             # Use the cached function for efficiency
             return await get_multiple_symbols_data_cached(symbols)
         except Exception as e:
-            print(f"Error fetching data for multiple symbols: {e}")
+            logger.warning("Error fetching data for multiple symbols: %s", e)
             return {symbol: {} for symbol in symbols}
     
-    async def fetch_fund_flow(self, symbol: str, limit: int = 100) -> Optional[FundFlow]:
+    async def fetch_fund_flow(self, symbol: str, limit: int = 100,
+                              tick_ts: datetime = None) -> Optional[FundFlow]:
         """
         Analyze fund flow based on recent trades using the new API integration
         """
@@ -154,37 +315,34 @@ class ImprovedDataFetcher:
         
         try:
             # Get technical data which includes trades
-            tech_data = await get_technical_data_cached(symbol, get_config('KLINE_INTERVAL'), limit)
+            tech_data = await get_technical_data_cached(symbol, self._kline_interval, limit)
             trades = tech_data.get('trades', [])
             
             if not trades:
-                print(f"No trade data available for {symbol}")
+                logger.warning("No trade data available for %s", symbol)
                 return None
             
-            buy_volume = 0
-            sell_volume = 0
-            buy_count = 0
-            sell_count = 0
-            
-            for trade in trades:
-                # 'm' indicates whether buyer is maker (True) or seller is maker (False)
-                if trade.get('m', True):  # Seller is maker (buying pressure)
-                    buy_volume += safe_float_conversion(trade.get('q', 0))
-                    buy_count += 1
-                else:  # Buyer is maker (selling pressure)
-                    sell_volume += safe_float_conversion(trade.get('q', 0))
-                    sell_count += 1
-            
+            # 'm' indicates whether buyer is maker (True) or seller is maker
+            # (False); seller-maker trades count as buying pressure.
+            # fromiter casts each quantity in C; one nan_to_num pass scrubs
+            # NaN instead of a safe_float_conversion call per trade.
+            q = np.fromiter((t.get('q', 0) for t in trades),
+                            dtype=np.float64, count=len(trades))
+            np.nan_to_num(q, copy=False)
+            m = np.fromiter((bool(t.get('m', True)) for t in trades),
+                            dtype=bool, count=len(trades))
+
+            buy_volume, sell_volume, buy_count, sell_count = _ff_reduce(q, m)
+
             total_volume = buy_volume + sell_volume
             buy_ratio = buy_volume / total_volume if total_volume > 0 else 0
             sell_ratio = sell_volume / total_volume if total_volume > 0 else 0
             
-            from .models import SignalDirection
             flow_direction = SignalDirection.BULLISH if buy_ratio > sell_ratio else SignalDirection.BEARISH
             
             fund_flow = FundFlow(
                 symbol=symbol,
-                timestamp=tech_data.get('timestamp', datetime.now()),
+                timestamp=tech_data.get('timestamp') or tick_ts or datetime.now(),
                 buy_volume=buy_volume,
                 sell_volume=sell_volume,
                 total_volume=total_volume,
@@ -199,10 +357,11 @@ class ImprovedDataFetcher:
             return fund_flow
             
         except Exception as e:
-            print(f"Error analyzing fund flow for {symbol}: {e}")
+            logger.warning("Error analyzing fund flow for %s: %s", symbol, e)
             return None
     
-    async def fetch_oi_data(self, symbol: str) -> Optional[OISignal]:
+    async def fetch_oi_data(self, symbol: str,
+                            tick_ts: datetime = None) -> Optional[OISignal]:
         """
         Fetch Open Interest data (placeholder - would connect to futures data source)
         """
@@ -222,16 +381,13 @@ class ImprovedDataFetcher:
             # 2. Compare current OI to historical values to determine surges
             # 3. Calculate magnitude and direction
             
-            from .models import SignalDirection
-            import random
-            
             # Simulated values based on real data patterns
-            magnitude = random.uniform(0, 20) if oi_value else 0
-            direction = SignalDirection.BULLISH if random.random() > 0.5 else SignalDirection.BEARISH
+            magnitude = float(self._rng.uniform(0, 20)) if oi_value else 0.0
+            direction = SignalDirection.BULLISH if self._rng.random() > 0.5 else SignalDirection.BEARISH
             
             oi_signal = OISignal(
                 symbol=symbol,
-                timestamp=datetime.now(),
+                timestamp=tick_ts or datetime.now(),
                 magnitude=magnitude,
                 direction=direction,
                 source="futures_api"
@@ -240,7 +396,7 @@ class ImprovedDataFetcher:
             return oi_signal
             
         except Exception as e:
-            print(f"Error fetching OI data for {symbol}: {e}")
+            logger.warning("Error fetching OI data for %s: %s", symbol, e)
             return None
     
     async def fetch_symbol_data(self, symbol: str) -> Dict:
@@ -248,20 +404,43 @@ class ImprovedDataFetcher:
         Fetch comprehensive data for a single symbol using the new API integration
         """
         await self.initialize()
-        
-        # Get all data concurrently for efficiency
-        market_data = await get_symbol_data(symbol)
-        
+
+        # One clock read shared by every fallback timestamp of this tick
+        tick_ts = datetime.now()
+
+        # The sub-fetches are independent I/O calls; gather overlaps their
+        # round-trips so wall time is bounded by the slowest one instead of
+        # the sum. A failed fetch degrades that field without losing the rest.
+        market_data, klines, fund_flow = await asyncio.gather(
+            get_symbol_data(symbol),
+            self.fetch_kline_data(symbol),
+            self.fetch_fund_flow(symbol, tick_ts=tick_ts),
+            return_exceptions=True
+        )
+        if isinstance(market_data, Exception):
+            logger.warning("Error fetching market data for %s: %s", symbol, market_data)
+            market_data = {}
+        if isinstance(klines, Exception):
+            klines = []
+        if isinstance(fund_flow, Exception):
+            fund_flow = None
+
+        # The order book ships inside market_data; parse it without a
+        # second upstream fetch
+        order_book = await self.fetch_order_book_depth(
+            symbol, market_data=market_data, tick_ts=tick_ts
+        )
+
         data = {
             'symbol': symbol,
-            'klines': await self.fetch_kline_data(symbol),
-            'order_book': await self.fetch_order_book_depth(symbol),
-            'fund_flow': await self.fetch_fund_flow(symbol),
+            'klines': klines,
+            'order_book': order_book,
+            'fund_flow': fund_flow,
             'current_price': market_data.get('price', 0.0),
             'ticker_24h': market_data.get('ticker_24h', {}),
-            'timestamp': market_data.get('timestamp', datetime.now())
+            'timestamp': market_data.get('timestamp') or tick_ts
         }
-        
+
         return data
 
 
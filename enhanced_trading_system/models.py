@@ -2,10 +2,20 @@
 Data models for the Enhanced Trading Analysis System
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 from enum import Enum
+import json
+
+import numpy as np
+
+# C-level JSON encoder for the serialization boundary; the stdlib
+# encoder is the fallback on minimal installs
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class SignalDirection(Enum):
@@ -22,7 +32,57 @@ class Recommendation(Enum):
     STRONG_SELL = "STRONG_SELL"
 
 
-@dataclass
+@dataclass(slots=True)
+class IndicatorSnapshot:
+    """Flat, typed snapshot of the technical indicators for one symbol
+
+    Attribute access on a slotted dataclass avoids the repeated nested
+    dict lookups (`tech_data.get('macd', {}).get('macd', 0)`) that the
+    scoring hot path would otherwise perform on every call.
+    """
+    symbol: str
+    timestamp: datetime
+    rsi: float
+    macd: float
+    macd_signal: float
+    macd_histogram: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    ma_5: float
+    ma_10: float
+    ma_20: float
+    ma_50: float
+    current_price: float
+
+    def to_dict(self):
+        """Serialize to the nested dict layout used by the signal panel"""
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'rsi': self.rsi,
+            'macd': {
+                'macd': self.macd,
+                'signal': self.macd_signal,
+                'histogram': self.macd_histogram
+            },
+            'bollinger_bands': {
+                'upper': self.bb_upper,
+                'middle': self.bb_middle,
+                'lower': self.bb_lower,
+                'current_price': self.current_price
+            },
+            'moving_averages': {
+                'ma_5': self.ma_5,
+                'ma_10': self.ma_10,
+                'ma_20': self.ma_20,
+                'ma_50': self.ma_50,
+                'current_price': self.current_price
+            }
+        }
+
+
+@dataclass(slots=True)
 class TechnicalIndicators:
     """Technical indicators data"""
     symbol: str
@@ -31,14 +91,19 @@ class TechnicalIndicators:
     macd: Dict[str, float]
     bollinger_bands: Dict[str, float]
     moving_averages: Dict[str, float]
-    
+
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'rsi': self.rsi,
+            'macd': self.macd,
+            'bollinger_bands': self.bollinger_bands,
+            'moving_averages': self.moving_averages
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class KlineData:
     """K-line data structure"""
     symbol: str
@@ -53,32 +118,122 @@ class KlineData:
     number_of_trades: int
     taker_buy_base_asset_volume: float
     taker_buy_quote_asset_volume: float
-    
+
     def to_dict(self):
-        return asdict(self)
+        return {
+            'symbol': self.symbol,
+            'open_time': self.open_time,
+            'open': self.open,
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume,
+            'close_time': self.close_time,
+            'quote_asset_volume': self.quote_asset_volume,
+            'number_of_trades': self.number_of_trades,
+            'taker_buy_base_asset_volume': self.taker_buy_base_asset_volume,
+            'taker_buy_quote_asset_volume': self.taker_buy_quote_asset_volume
+        }
+
+
+@dataclass(slots=True)
+class KlineBatch:
+    """Structure-of-arrays kline batch
+
+    Holds one contiguous ndarray per column so indicator code can run
+    vectorized over whole series instead of iterating KlineData
+    objects; indexing materializes a KlineData lazily for consumers
+    that still want per-candle objects.
+    """
+    symbol: str
+    open_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    close_time: np.ndarray
+    quote_asset_volume: np.ndarray
+    number_of_trades: np.ndarray
+    taker_buy_base_asset_volume: np.ndarray
+    taker_buy_quote_asset_volume: np.ndarray
 
+    def __len__(self):
+        return len(self.open_time)
 
-@dataclass
+    def __getitem__(self, i: int) -> KlineData:
+        return KlineData(
+            symbol=self.symbol,
+            open_time=int(self.open_time[i]),
+            open=float(self.open[i]),
+            high=float(self.high[i]),
+            low=float(self.low[i]),
+            close=float(self.close[i]),
+            volume=float(self.volume[i]),
+            close_time=int(self.close_time[i]),
+            quote_asset_volume=float(self.quote_asset_volume[i]),
+            number_of_trades=int(self.number_of_trades[i]),
+            taker_buy_base_asset_volume=float(self.taker_buy_base_asset_volume[i]),
+            taker_buy_quote_asset_volume=float(self.taker_buy_quote_asset_volume[i])
+        )
+
+    def to_klines(self) -> List[KlineData]:
+        return [self[i] for i in range(len(self))]
+
+
+@dataclass(slots=True)
 class OrderBookDepth:
-    """Order book depth data"""
+    """Order book depth data
+
+    bids/asks are (N, 2) float arrays of price/quantity rows, so
+    downstream code can slice columns (`bids[:, 0]` for prices) without
+    per-level dict lookups; the *_price/*_qty properties expose the
+    columns directly for feature code. Python lists appear only at the
+    to_dict serialization boundary.
+    """
     symbol: str
     timestamp: datetime
-    bids: List[Dict[str, float]]
-    asks: List[Dict[str, float]]
+    bids: np.ndarray
+    asks: np.ndarray
     bid_volume: float
     ask_volume: float
-    bid_cumulative: List[float]
-    ask_cumulative: List[float]
+    bid_cumulative: np.ndarray
+    ask_cumulative: np.ndarray
     spread: float
     spread_percentage: float
-    
+
+    @property
+    def bids_price(self) -> np.ndarray:
+        return self.bids[:, 0]
+
+    @property
+    def bids_qty(self) -> np.ndarray:
+        return self.bids[:, 1]
+
+    @property
+    def asks_price(self) -> np.ndarray:
+        return self.asks[:, 0]
+
+    @property
+    def asks_qty(self) -> np.ndarray:
+        return self.asks[:, 1]
+
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'bids': [{'price': p, 'quantity': q} for p, q in np.asarray(self.bids).tolist()],
+            'asks': [{'price': p, 'quantity': q} for p, q in np.asarray(self.asks).tolist()],
+            'bid_volume': self.bid_volume,
+            'ask_volume': self.ask_volume,
+            'bid_cumulative': np.asarray(self.bid_cumulative).tolist(),
+            'ask_cumulative': np.asarray(self.ask_cumulative).tolist(),
+            'spread': self.spread,
+            'spread_percentage': self.spread_percentage
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class FundFlow:
     """Fund flow analysis data"""
     symbol: str
@@ -92,15 +247,24 @@ class FundFlow:
     buy_trade_count: int
     sell_trade_count: int
     flow_direction: SignalDirection
-    
+
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        result['flow_direction'] = self.flow_direction.value
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'buy_volume': self.buy_volume,
+            'sell_volume': self.sell_volume,
+            'total_volume': self.total_volume,
+            'buy_ratio': self.buy_ratio,
+            'sell_ratio': self.sell_ratio,
+            'net_flow': self.net_flow,
+            'buy_trade_count': self.buy_trade_count,
+            'sell_trade_count': self.sell_trade_count,
+            'flow_direction': self.flow_direction.value
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class OISignal:
     """Open Interest signal data"""
     symbol: str
@@ -108,27 +272,35 @@ class OISignal:
     magnitude: float
     direction: SignalDirection
     source: str = "external"  # Source of the OI signal
-    
+
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        result['direction'] = self.direction.value
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'magnitude': self.magnitude,
+            'direction': self.direction.value,
+            'source': self.source
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskParameters:
     """Risk management parameters"""
     stop_loss: Optional[float]
     take_profit: Optional[float]
     risk_percentage: float
     risk_reward_ratio: float
-    
+
     def to_dict(self):
-        return asdict(self)
+        return {
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'risk_percentage': self.risk_percentage,
+            'risk_reward_ratio': self.risk_reward_ratio
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Integrated trading signal"""
     symbol: str
@@ -144,24 +316,22 @@ class TradingSignal:
     volatility: Optional[float] = None
     
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        result['recommendation'] = self.recommendation.value
-        
-        # Convert nested objects to dict if they exist
-        if self.technical_indicators:
-            result['technical_indicators'] = self.technical_indicators.to_dict()
-        if self.oi_signals:
-            result['oi_signals'] = self.oi_signals.to_dict()
-        if self.fund_flow:
-            result['fund_flow'] = self.fund_flow.to_dict()
-        if self.risk_management:
-            result['risk_management'] = self.risk_management.to_dict()
-        
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'composite_score': self.composite_score,
+            'score_components': self.score_components,
+            'recommendation': self.recommendation.value,
+            'confidence_level': self.confidence_level,
+            'technical_indicators': self.technical_indicators.to_dict() if self.technical_indicators else None,
+            'oi_signals': self.oi_signals.to_dict() if self.oi_signals else None,
+            'fund_flow': self.fund_flow.to_dict() if self.fund_flow else None,
+            'risk_management': self.risk_management.to_dict() if self.risk_management else None,
+            'volatility': self.volatility
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignalPanel:
     """Collection of trading signals for multiple symbols"""
     timestamp: datetime
@@ -176,8 +346,20 @@ class TradingSignalPanel:
         }
         return result
 
+    def to_json(self) -> bytes:
+        """Serialize the whole panel to JSON bytes in one shot
+
+        Prefer this over json.dumps(panel.to_dict()) at write-out sites:
+        orjson walks the dict tree in C, which matters when the panel
+        carries hundreds of signals.
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data).encode('utf-8')
 
-@dataclass
+
+@dataclass(slots=True)
 class HistoricalDataPoint:
     """Historical data point for backtesting and analysis"""
     symbol: str
@@ -187,17 +369,21 @@ class HistoricalDataPoint:
     indicators: Dict[str, float]  # All calculated indicators at this point
     signal: Optional[Recommendation] = None
     actual_return: Optional[float] = None  # Actual return after some period
-    
+
     def to_dict(self):
-        result = asdict(self)
-        result['timestamp'] = self.timestamp.isoformat()
-        if self.signal:
-            result['signal'] = self.signal.value
-        return result
+        return {
+            'symbol': self.symbol,
+            'timestamp': self.timestamp.isoformat(),
+            'price': self.price,
+            'volume': self.volume,
+            'indicators': self.indicators,
+            'signal': self.signal.value if self.signal else None,
+            'actual_return': self.actual_return
+        }
 
 
 # Additional utility classes
-@dataclass
+@dataclass(slots=True)
 class MarketSnapshot:
     """Complete market snapshot at a point in time"""
     timestamp: datetime
@@ -223,7 +409,7 @@ class MarketSnapshot:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Result of a backtesting operation"""
     strategy_name: str
@@ -242,9 +428,23 @@ class BacktestResult:
     losing_trades: int
     avg_win: float
     avg_loss: float
-    
+
     def to_dict(self):
-        result = asdict(self)
-        result['start_date'] = self.start_date.isoformat()
-        result['end_date'] = self.end_date.isoformat()
-        return result
\ No newline at end of file
+        return {
+            'strategy_name': self.strategy_name,
+            'start_date': self.start_date.isoformat(),
+            'end_date': self.end_date.isoformat(),
+            'initial_capital': self.initial_capital,
+            'final_capital': self.final_capital,
+            'total_return': self.total_return,
+            'annualized_return': self.annualized_return,
+            'volatility': self.volatility,
+            'sharpe_ratio': self.sharpe_ratio,
+            'max_drawdown': self.max_drawdown,
+            'win_rate': self.win_rate,
+            'trades_executed': self.trades_executed,
+            'winning_trades': self.winning_trades,
+            'losing_trades': self.losing_trades,
+            'avg_win': self.avg_win,
+            'avg_loss': self.avg_loss
+        }
\ No newline at end of file
@@ -7,6 +7,8 @@ Runs continuous analysis and displays results
 import asyncio
 import time
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from datetime import datetime
 import sys
 import os
@@ -17,95 +19,108 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from core_engine import EnhancedTradingSystem
 from oi_radar_integration import OISpikeRadarIntegration
 
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# Route this module's records through a queue so formatting and stdout
+# writes happen on the listener thread, not the event loop
+if not logger.handlers:
+    _log_queue = SimpleQueue()
+    logger.addHandler(QueueHandler(_log_queue))
+    # Keep records off the root handler installed by basicConfig so
+    # they are emitted once, by the listener
+    logger.propagate = False
+    _log_listener = QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
 
 async def run_monitoring():
     """
     Run continuous monitoring of the trading system
     """
-    print("=" * 80)
-    print("🚀 ENHANCED TRADING ANALYSIS SYSTEM - MONITORING MODE")
-    print("Running continuous analysis with integrated OI Spike + Technical Indicators")
-    print("=" * 80)
-    
+    logger.info("=" * 80)
+    logger.info("🚀 ENHANCED TRADING ANALYSIS SYSTEM - MONITORING MODE")
+    logger.info("Running continuous analysis with integrated OI Spike + Technical Indicators")
+    logger.info("=" * 80)
+
     # Initialize the trading system
     trading_system = EnhancedTradingSystem()
-    
+
     # Define symbols to monitor (top liquid pairs)
     symbols = [
-        'BTCUSDT', 
-        'ETHUSDT', 
+        'BTCUSDT',
+        'ETHUSDT',
         'SOLUSDT'
     ]
-    
-    print(f"\n🔍 Monitoring {len(symbols)} symbols:")
+
+    logger.info("🔍 Monitoring %d symbols:", len(symbols))
     for symbol in symbols:
-        print(f"   • {symbol}")
-    
-    print("\n📊 Starting continuous analysis (updates every 30 seconds)...")
-    print("Press Ctrl+C to stop\n")
-    
+        logger.info("   • %s", symbol)
+
+    logger.info("📊 Starting continuous analysis (updates every 30 seconds)...")
+    logger.info("Press Ctrl+C to stop")
+
     try:
         while True:
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Running analysis...")
-            
+            logger.info("[%s] Running analysis...", datetime.now().strftime('%H:%M:%S'))
+
             try:
                 # Generate comprehensive trading signal panel
                 signal_panel = await trading_system.generate_trading_signal_panel(symbols)
-                
+
                 if signal_panel:
-                    print(f"\n📋 LATEST SIGNALS:")
-                    print("-" * 60)
-                    
+                    logger.info("📋 LATEST SIGNALS:")
+                    logger.info("-" * 60)
+
                     for signal in signal_panel:
                         symbol = signal['symbol']
                         rec = signal['recommendation']
                         conf = signal['confidence_level']
                         price = signal.get('current_price', 'N/A')
                         comp_score = signal['composite_score']
-                        
-                        print(f"• {symbol:8} | {rec:12} | Conf: {conf:5.1f}% | Score: {comp_score:+.3f} | Price: {price}")
-                        
+
+                        logger.info("• %-8s | %-12s | Conf: %5.1f%% | Score: %+.3f | Price: %s",
+                                    symbol, rec, conf, comp_score, price)
+
                         # Show key technical indicators if available
                         tech_ind = signal.get('technical_indicators', {})
                         if tech_ind:
                             rsi = tech_ind.get('rsi', 'N/A')
                             if rsi != 'N/A':
-                                print(f"    RSI: {rsi:.2f}")
-                        
+                                logger.info("    RSI: %.2f", rsi)
+
                         # Show risk management if available
                         risk_mgmt = signal.get('risk_management', {})
                         if risk_mgmt.get('stop_loss'):
-                            sl = risk_mgmt['stop_loss']
-                            tp = risk_mgmt['take_profit']
-                            print(f"    Risk Mgmt: SL {sl} | TP {tp}")
-                
+                            logger.info("    Risk Mgmt: SL %s | TP %s",
+                                        risk_mgmt['stop_loss'], risk_mgmt['take_profit'])
+
                     # Summary
                     total_analyzed = len(signal_panel)
                     buy_signals = len([s for s in signal_panel if 'BUY' in s['recommendation']])
                     sell_signals = len([s for s in signal_panel if 'SELL' in s['recommendation']])
                     hold_signals = len([s for s in signal_panel if s['recommendation'] == 'HOLD'])
-                    
-                    print(f"\n📈 Summary: {total_analyzed} analyzed | {buy_signals} buys | {sell_signals} sells | {hold_signals} holds")
+
+                    logger.info("📈 Summary: %d analyzed | %d buys | %d sells | %d holds",
+                                total_analyzed, buy_signals, sell_signals, hold_signals)
                 else:
-                    print("⚠️  No signals generated (may be due to API limitations)")
-            
-            except Exception as e:
-                print(f"⚠️  Error during analysis: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            print("-" * 80)
-            
+                    logger.warning("⚠️  No signals generated (may be due to API limitations)")
+
+            except Exception:
+                # logger.exception formats the stack on the listener
+                # thread, so an error storm cannot stall the fetch loop
+                logger.exception("⚠️  Error during analysis")
+
+            logger.info("-" * 80)
+
             # Wait before next analysis
             await asyncio.sleep(30)
-            
+
     except KeyboardInterrupt:
-        print(f"\n🛑 Monitoring stopped by user at {datetime.now().strftime('%H:%M:%S')}")
-    except Exception as e:
-        print(f"❌ Fatal error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.info("🛑 Monitoring stopped by user at %s", datetime.now().strftime('%H:%M:%S'))
+    except Exception:
+        logger.exception("❌ Fatal error")
 
 
 if __name__ == "__main__":
-    asyncio.run(run_monitoring())
\ No newline at end of file
+    asyncio.run(run_monitoring())
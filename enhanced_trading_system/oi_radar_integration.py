@@ -10,23 +10,57 @@ import time
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import numpy as np
+
+# Fastest available JSON decoder: msgspec and orjson parse in C, several
+# times faster than the stdlib on the small alert payloads polled here
+try:
+    from msgspec.json import decode as _json_loads
+except ImportError:
+    try:
+        import orjson
+        _json_loads = orjson.loads
+    except ImportError:
+        import json
+        _json_loads = json.loads
+
+# Shared Generator for mock-signal draws; one vectorized call per batch
+# instead of per-symbol random.* lookups, and seedable for reproducibility
+_rng = np.random.default_rng()
+
 
 class OISpikeRadarIntegration:
     """
     Integration class for OI Spike Radar system
     """
     
-    def __init__(self, base_url: str = "http://localhost:8081"):  # Changed to use enhanced version
+    def __init__(self, base_url: str = "http://localhost:8081", session: aiohttp.ClientSession = None):  # Changed to use enhanced version
         self.base_url = base_url
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         self.logger = logging.getLogger(__name__)
-        
+
+    def use_session(self, session: aiohttp.ClientSession):
+        """Adopt a shared HTTP session owned by the caller"""
+        self.session = session
+        self._owns_session = False
+
     async def initialize(self):
         """Initialize the HTTP session"""
         if self.session is None:
+            # Keep-alive plus DNS caching so the 30s polling loop reuses
+            # one warm connection instead of paying TCP/TLS setup per poll
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=aiohttp.ClientTimeout(total=30)
             )
+            self._owns_session = True
     
     async def get_latest_signals(self) -> List[Dict]:
         """
@@ -38,7 +72,7 @@ class OISpikeRadarIntegration:
             # Try to get signals from the radar system - using the correct endpoint
             async with self.session.get(f"{self.base_url}/api/alerts?limit=20") as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = _json_loads(await response.read())
                     # Handle both array responses and object responses with alerts property
                     if isinstance(data, list):
                         alerts = data
@@ -47,21 +81,20 @@ class OISpikeRadarIntegration:
                     else:
                         alerts = []
                     
-                    # Transform the data to match our expected format
-                    transformed_signals = []
-                    for alert in alerts:
-                        if isinstance(alert, dict):
-                            transformed_signal = {
-                                'symbol': alert.get('symbol'),
-                                'timestamp': alert.get('ts', time.time()),
-                                'direction': alert.get('direction', 'NEUTRAL'),
-                                'magnitude': alert.get('score_total', 0),
-                                'score': alert.get('score_total', 0),
-                                'details': alert  # Keep full details in case they're needed
-                            }
-                            transformed_signals.append(transformed_signal)
-                    
-                    return transformed_signals
+                    # Transform the data to match our expected format; the
+                    # comprehension builds each dict in one bytecode pass
+                    # with no repeated .append lookups
+                    return [
+                        {
+                            'symbol': alert.get('symbol'),
+                            'timestamp': alert.get('ts', time.time()),
+                            'direction': alert.get('direction', 'NEUTRAL'),
+                            'magnitude': alert.get('score_total', 0),
+                            'score': alert.get('score_total', 0),
+                            'details': alert  # Keep full details in case they're needed
+                        }
+                        for alert in alerts if isinstance(alert, dict)
+                    ]
                 else:
                     self.logger.warning(f"OI Radar returned status {response.status}")
                     # Return mock data if the actual system is not available
@@ -87,7 +120,7 @@ class OISpikeRadarIntegration:
         try:
             async with self.session.get(f"{self.base_url}/api/status") as response:
                 if response.status == 200:
-                    return await response.json()
+                    return _json_loads(await response.read())
                 else:
                     return {"status": "unavailable", "error": f"Status code {response.status}"}
         except Exception as e:
@@ -98,34 +131,34 @@ class OISpikeRadarIntegration:
         """
         Generate mock OI signals for testing purposes
         """
-        import random
-        from datetime import datetime
-        
         # Mock symbols
         symbols = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "ADAUSDT"]
-        
-        # Generate mock signals
-        mock_signals = []
-        for symbol in random.sample(symbols, min(3, len(symbols))):
-            # Random direction: mostly neutral, occasional spikes
-            directions = ['BULLISH', 'BEARISH', 'NEUTRAL', 'NEUTRAL', 'NEUTRAL']
-            direction = random.choice(directions)
-            
-            if direction != 'NEUTRAL':
-                signal = {
-                    'symbol': symbol,
-                    'timestamp': datetime.now().isoformat(),
-                    'direction': direction,
-                    'magnitude': round(random.uniform(5.0, 25.0), 2),  # 5-25% spike
-                    'score': round(random.uniform(1.0, 3.0), 2)  # Normalized score
-                }
-                mock_signals.append(signal)
-        
-        return mock_signals
+        n = min(3, len(symbols))
+
+        # One batched draw per field; directions stay mostly neutral with
+        # occasional spikes, matching the old per-symbol sampling
+        picks = _rng.choice(symbols, size=n, replace=False)
+        directions = _rng.choice(
+            ['BULLISH', 'BEARISH', 'NEUTRAL', 'NEUTRAL', 'NEUTRAL'], size=n
+        )
+        magnitudes = np.round(_rng.uniform(5.0, 25.0, n), 2)  # 5-25% spike
+        scores = np.round(_rng.uniform(1.0, 3.0, n), 2)  # Normalized score
+        timestamp = datetime.now().isoformat()
+
+        return [
+            {
+                'symbol': str(picks[i]),
+                'timestamp': timestamp,
+                'direction': str(directions[i]),
+                'magnitude': float(magnitudes[i]),
+                'score': float(scores[i])
+            }
+            for i in range(n) if directions[i] != 'NEUTRAL'
+        ]
     
     async def close(self):
         """
-        Close the HTTP session
+        Close the HTTP session (no-op for shared sessions owned by the caller)
         """
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
\ No newline at end of file
@@ -202,15 +202,44 @@ class TechnicalIndicatorCalculator:
     def _ema(self, data: List[float], period: int) -> np.ndarray:
         """
         Calculate Exponential Moving Average
+
+        The recurrence ema[i] = a*x[i] + (1-a)*ema[i-1] is rewritten on
+        rescaled terms so a cumsum replaces the Python loop: dividing by
+        pw[i] = (1-a)**i turns it into a running sum, and multiplying
+        back restores the EMA. The cumsum runs over bounded blocks,
+        carrying the seed across block edges, so pw never underflows on
+        long series. Same seed (ema[0] = x[0]) and the same ndarray
+        return as the loop version, computed in C.
         """
-        data_array = np.array(data)
-        ema = np.zeros_like(data_array)
-        ema[0] = data_array[0]
-        
+        data_array = np.asarray(data, dtype=np.float64)
+        n = data_array.size
+        if n == 0:
+            return data_array
+
         multiplier = 2 / (period + 1)
-        for i in range(1, len(data_array)):
-            ema[i] = (data_array[i] * multiplier) + (ema[i-1] * (1 - multiplier))
-        
+        decay = 1.0 - multiplier
+
+        ema = np.empty_like(data_array)
+        ema[0] = data_array[0]
+        if decay <= 0.0:
+            # period == 1 degenerates to ema[i] = x[i]
+            ema[1:] = data_array[1:]
+            return ema
+
+        # Largest block for which decay**block stays comfortably inside
+        # the float64 range (decay**block >= ~1e-217)
+        block = max(1, min(n, int(-500.0 / np.log(decay))))
+        powers = np.power(decay, np.arange(block))
+
+        seed = ema[0]
+        for start in range(1, n, block):
+            stop = min(start + block, n)
+            pw = powers[:stop - start]
+            scaled = np.cumsum(multiplier * data_array[start:stop] / pw)
+            scaled += seed * decay
+            ema[start:stop] = pw * scaled
+            seed = ema[stop - 1]
+
         return ema
     
     def _sma(self, data: List[float], period: int) -> np.ndarray:
@@ -102,24 +102,24 @@ class EnhancedTradingSystem:
             indicators = {
                 'symbol': symbol,
                 'timestamp': datetime.now().isoformat(),
-                'rsi': rsi.iloc[-1],
+                'rsi': rsi.to_numpy()[-1],
                 'macd': {
-                    'macd': macd.iloc[-1],
-                    'signal': signal.iloc[-1],
-                    'histogram': histogram.iloc[-1]
+                    'macd': macd.to_numpy()[-1],
+                    'signal': signal.to_numpy()[-1],
+                    'histogram': histogram.to_numpy()[-1]
                 },
                 'bollinger_bands': {
-                    'upper': upper_band.iloc[-1],
-                    'middle': sma_20.iloc[-1],
-                    'lower': lower_band.iloc[-1],
-                    'current_price': df['close'].iloc[-1]
+                    'upper': upper_band.to_numpy()[-1],
+                    'middle': sma_20.to_numpy()[-1],
+                    'lower': lower_band.to_numpy()[-1],
+                    'current_price': df['close'].to_numpy()[-1]
                 },
                 'moving_averages': {
-                    'ma_5': ma_5.iloc[-1],
-                    'ma_10': ma_10.iloc[-1],
-                    'ma_20': ma_20.iloc[-1],
-                    'ma_50': ma_50.iloc[-1],
-                    'current_price': df['close'].iloc[-1]
+                    'ma_5': ma_5.to_numpy()[-1],
+                    'ma_10': ma_10.to_numpy()[-1],
+                    'ma_20': ma_20.to_numpy()[-1],
+                    'ma_50': ma_50.to_numpy()[-1],
+                    'current_price': df['close'].to_numpy()[-1]
                 }
             }
             
@@ -56,9 +56,9 @@ def calculate_macd(prices: List[float], fast: int = 12, slow: int = 26, signal:
     histogram = macd_line - signal_line
     
     return {
-        'macd': float(macd_line.iloc[-1]),
-        'signal': float(signal_line.iloc[-1]),
-        'histogram': float(histogram.iloc[-1])
+        'macd': float(macd_line.to_numpy()[-1]),
+        'signal': float(signal_line.to_numpy()[-1]),
+        'histogram': float(histogram.to_numpy()[-1])
     }
 
 
@@ -83,9 +83,9 @@ def calculate_bollinger_bands(prices: List[float], period: int = 20, std_dev: in
     lower_band = sma - (std * std_dev)
     
     return {
-        'upper': float(upper_band.iloc[-1]),
-        'middle': float(sma.iloc[-1]),
-        'lower': float(lower_band.iloc[-1]),
+        'upper': float(upper_band.to_numpy()[-1]),
+        'middle': float(sma.to_numpy()[-1]),
+        'lower': float(lower_band.to_numpy()[-1]),
         'current_price': float(prices[-1])
     }
 
@@ -106,7 +106,7 @@ def calculate_moving_averages(prices: List[float], periods: List[int] = None) ->
     for period in periods:
         if len(prices) >= period:
             ma = series.rolling(window=period).mean()
-            mas[f'ma_{period}'] = float(ma.iloc[-1])
+            mas[f'ma_{period}'] = float(ma.to_numpy()[-1])
         else:
             mas[f'ma_{period}'] = float(prices[-1])
     
@@ -172,9 +172,10 @@ def analyze_order_flow(order_book: OrderBookDepth) -> Dict[str, Any]:
     bid_ask_ratio = total_bid_volume / total_ask_volume if total_ask_volume > 0 else float('inf')
     order_imbalance = (total_bid_volume - total_ask_volume) / total_volume
     
-    # Determine pressure based on top levels
-    top_bids = sum([item['quantity'] for item in order_book.bids[:5]]) if order_book.bids else 0
-    top_asks = sum([item['quantity'] for item in order_book.asks[:5]]) if order_book.asks else 0
+    # Determine pressure based on top levels; bids/asks are (N, 2)
+    # price/quantity arrays
+    top_bids = float(order_book.bids[:5, 1].sum()) if len(order_book.bids) else 0
+    top_asks = float(order_book.asks[:5, 1].sum()) if len(order_book.asks) else 0
     
     total_top_volume = top_bids + top_asks
     if total_top_volume > 0:
@@ -203,8 +204,8 @@ def detect_trend(prices: List[float], ma_short: int = 5, ma_long: int = 20) -> s
         return 'NEUTRAL'
     
     series = pd.Series(prices)
-    short_ma = series.rolling(window=ma_short).mean().iloc[-1]
-    long_ma = series.rolling(window=ma_long).mean().iloc[-1]
+    short_ma = series.rolling(window=ma_short).mean().to_numpy()[-1]
+    long_ma = series.rolling(window=ma_long).mean().to_numpy()[-1]
     current_price = prices[-1]
     
     # Determine trend based on MA relationship and price position